@@ -21,33 +21,24 @@ def get_oil_adhesions(oil_columns, field_indexes):
 
 
 def get_adhesions_by_weathering(oil_columns, field_indexes, weathering):
-    adhesions = []
-
     props = get_oil_properties_by_category(oil_columns, field_indexes,
                                            'adhesion_g_cm2_ests_1996')
-    prop_names = props.keys()
+    prop_names = tuple(props.keys())
+    rows = zip(*props.values())
+    adhesion_col = prop_names.index('adhesion')
 
-    for idx, vals in enumerate(zip(*props.values())):
-        adhesion_kwargs = build_adhesion_kwargs(prop_names, vals,
-                                                weathering[idx])
-        adhesions.append(adhesion_kwargs)
+    adhesions = (build_adhesion_args(vals[adhesion_col][0], weathering[idx])
+                 for idx, vals in enumerate(rows)
+                 if vals[adhesion_col][0] is not None)
 
-    return [Adhesion(**a) for a in adhesions
-            if a['kg_m_2'] is not None]
+    return [Adhesion.from_row(*a) for a in adhesions]
 
 
-def build_adhesion_kwargs(prop_names, values, weathering):
+def build_adhesion_args(adhesion, weathering):
     '''
-        Build adhesion properties dictionary suitable to be passed in as
-        keyword args.
-        - prop_names: The list of property names
-        - values: A list of Excel cell objects representing the properties.
+        Build adhesion properties tuple suitable to be passed in as
+        positional args to Adhesion.from_row().
+        - adhesion: The adhesion value in g/cm^2.
         - weathering: The fractional oil weathering amount.
     '''
-    adhesion_kwargs = dict(zip(prop_names, [v[0].value for v in values]))
-
-    adhesion_kwargs['weathering'] = weathering
-
-    adhesion_kwargs['kg_m_2'] = g_cm_2_to_kg_m_2(adhesion_kwargs['adhesion'])
-
-    return adhesion_kwargs
+    return g_cm_2_to_kg_m_2(adhesion), weathering
@@ -1,8 +1,10 @@
 
+import numpy as np
+
 from oil_library.models import Density
 
 from ec_xl_parse import (get_oil_properties_by_name,
-                         get_oil_properties_by_category)
+                         get_oil_properties_as_array)
 from ec_oil_props import get_oil_weathering
 
 
@@ -11,105 +13,52 @@ def get_oil_densities(oil_columns, field_indexes):
         Getting densities out of this datasheet is more tricky than it should
         be.  There are two categories, density at 15C, and density at 0/5C.
         I dunno, I would have organized the data in a more orthogonal way.
+
+        We gather the densities at all three temperatures in a single pass
+        over the oil columns, and convert their units together.
     '''
     weathering = get_oil_weathering(oil_columns, field_indexes)
-    densities_at_0c = get_oil_densities_at_0c(oil_columns,
-                                              field_indexes,
-                                              weathering)
-    densities_at_5c = get_oil_densities_at_5c(oil_columns,
-                                              field_indexes,
-                                              weathering)
-    densities_at_15c = get_oil_densities_at_15c(oil_columns,
-                                                field_indexes,
-                                                weathering)
-
-    return densities_at_0c + densities_at_5c + densities_at_15c
-
 
-def get_oil_densities_at_15c(oil_columns, field_indexes, weathering):
+    (names_15c,
+     values_15c) = get_oil_properties_as_array(oil_columns, field_indexes,
+                                               'density_at_15_c_g_ml_'
+                                               'astm_d5002')
+    (names_0_5c,
+     values_0_5c) = get_oil_properties_as_array(oil_columns, field_indexes,
+                                                'density_at_0_5_c_g_ml_'
+                                                'astm_d5002')
+
+    # Gather the densities at 0C, 5C and 15C for each of our weathered oil
+    # columns, and convert them from g/ml to kg/m^3 all at once.
+    # Empty cells become NaN values.
+    g_ml = np.array([values_0_5c[names_0_5c.index('density_0_c_g_ml'), :, 0],
+                     values_0_5c[names_0_5c.index('density_5_c_g_ml'), :, 0],
+                     values_15c[names_15c.index('density_15_c_g_ml'), :, 0]],
+                    dtype=np.float64)
+    kg_m_3 = g_ml * 1000.0
+
+    ref_temps = (273.15, 273.15 + 5.0, 273.15 + 15.0)
     densities = []
 
-    props = get_oil_properties_by_category(oil_columns, field_indexes,
-                                           'density_at_15_c_g_ml_astm_d5002')
-    prop_names = props.keys()
-
-    for idx, vals in enumerate(zip(*props.values())):
-        density_obj = dict(zip(prop_names, [v[0].value for v in vals]))
-
-        # add some properties to the oil that we expect
-        density_obj['idx'] = idx
-        density_obj['weathering'] = weathering[idx]
-        density_obj['ref_temp_k'] = 273.15 + 15.0
-
-        density_obj['kg_m_3'] = density_obj['density_15_c_g_ml']
-        if density_obj['kg_m_3'] is not None:
-            density_obj['kg_m_3'] *= 1000.0
-
-        # prune some properties that we don't want in our object
-        del density_obj['density_15_c_g_ml']
-
-        densities.append(density_obj)
-
-    return [Density(**d) for d in densities
-            if d['kg_m_3'] not in (None, 0.0)]
-
-
-def get_oil_densities_at_0c(oil_columns, field_indexes, weathering):
-    densities = []
-
-    props = get_oil_properties_by_category(oil_columns, field_indexes,
-                                           'density_at_0_5_c_g_ml_astm_d5002')
-    prop_names = props.keys()
-
-    for idx, vals in enumerate(zip(*props.values())):
-        density_obj = dict(zip(prop_names, [v[0].value for v in vals]))
+    for ref_temp_k, kg_m_3_at_temp in zip(ref_temps, kg_m_3.tolist()):
+        densities.extend([build_density_kwargs(d, w, ref_temp_k)
+                          for w, d in zip(weathering, kg_m_3_at_temp)
+                          if not (np.isnan(d) or d == 0.0)])
 
-        # add some properties to the oil that we expect
-        density_obj['idx'] = idx
-        density_obj['weathering'] = weathering[idx]
-        density_obj['ref_temp_k'] = 273.15
+    return [Density(**d) for d in densities]
 
-        density_obj['kg_m_3'] = density_obj['density_0_c_g_ml']
-        if density_obj['kg_m_3'] is not None:
-            density_obj['kg_m_3'] *= 1000.0
 
-        # prune some properties that we don't want in our object
-        del density_obj['density_0_c_g_ml']
-        del density_obj['density_5_c_g_ml']
-
-        densities.append(density_obj)
-
-    return [Density(**d) for d in densities
-            if d['kg_m_3'] not in (None, 0.0)]
-
-
-def get_oil_densities_at_5c(oil_columns, field_indexes, weathering):
-    densities = []
-
-    props = get_oil_properties_by_category(oil_columns, field_indexes,
-                                           'density_at_0_5_c_g_ml_astm_d5002')
-    prop_names = props.keys()
-
-    for idx, vals in enumerate(zip(*props.values())):
-        density_obj = dict(zip(prop_names, [v[0].value for v in vals]))
-
-        # add some properties to the oil that we expect
-        density_obj['idx'] = idx
-        density_obj['weathering'] = weathering[idx]
-        density_obj['ref_temp_k'] = 273.15 + 5.0
-
-        density_obj['kg_m_3'] = density_obj['density_5_c_g_ml']
-        if density_obj['kg_m_3'] is not None:
-            density_obj['kg_m_3'] *= 1000.0
-
-        # prune some properties that we don't want in our object
-        del density_obj['density_0_c_g_ml']
-        del density_obj['density_5_c_g_ml']
-
-        densities.append(density_obj)
-
-    return [Density(**d) for d in densities
-            if d['kg_m_3'] not in (None, 0.0)]
+def build_density_kwargs(kg_m_3, weathering, ref_temp_k):
+    '''
+        Build a density properties dictionary suitable to be passed in as
+        keyword args.
+        - kg_m_3: The density value in kg/m^3.
+        - weathering: The fractional oil weathering amount.
+        - ref_temp_k: The temperature of the oil at measurement time.
+    '''
+    return {'weathering': weathering,
+            'ref_temp_k': ref_temp_k,
+            'kg_m_3': kg_m_3}
 
 
 def get_oil_api(oil_columns, field_indexes):
@@ -118,4 +67,4 @@ def get_oil_api(oil_columns, field_indexes):
     '''
     cells = get_oil_properties_by_name(oil_columns, field_indexes,
                                        'api_gravity', 'calculated_api_gravity')
-    return [c[0].value for c in cells if c[0].value is not None]
+    return [c[0] for c in cells if c[0] is not None]
@@ -1,10 +1,20 @@
 
+from itertools import chain
+
 from ec_models import ECCut
 
 from ec_xl_parse import get_oil_properties_by_category, custom_slugify
 from ec_oil_props import get_oil_weathering
 from ec_oil_misc import celcius_to_kelvin
 
+# The boiling point distribution labels we care about are the percent values
+dist_fractions = tuple([(p / 100.0) for p in range(5, 100, 5)] + [1])
+dist_frac_labels = tuple(custom_slugify('{:0}'.format(f))
+                         for f in dist_fractions)
+
+# The cumulative weight fraction labels we care about are the temperatures (C)
+cumulative_frac_temps = list(range(40, 200, 20)) + list(range(200, 701, 50))
+
 
 def get_oil_distillation_cuts(oil_columns, field_indexes):
     '''
@@ -32,8 +42,7 @@ def get_oil_distillation_cuts(oil_columns, field_indexes):
                                                           field_indexes,
                                                           weathering)
 
-    return [item for sublist in (bp_distribution, bp_cumulative_frac)
-            for item in sublist]
+    return list(chain(bp_distribution, bp_cumulative_frac))
 
 
 def get_cuts_from_bp_distribution(oil_columns, field_indexes, weathering):
@@ -42,22 +51,28 @@ def get_cuts_from_bp_distribution(oil_columns, field_indexes, weathering):
     props = get_oil_properties_by_category(oil_columns, field_indexes,
                                            'boiling_point_'
                                            'distribution_temperature_c')
-    prop_names = props.keys()
+    prop_names = tuple(props.keys())
+    rows = zip(*props.values())
 
-    for idx, vals in enumerate(zip(*props.values())):
-        cuts_from_dist = build_cuts_from_dist_data(prop_names, vals,
-                                                   weathering[idx])
+    frac_cols = [prop_names.index(label) for label in dist_frac_labels]
+
+    for idx, vals in enumerate(rows):
+        cuts_from_dist = build_cuts_from_dist_data(dist_fractions, frac_cols,
+                                                   vals, weathering[idx])
         cuts.extend(cuts_from_dist)
 
-    return [c for c in cuts if c.vapor_temp_k is not None]
+    return cuts
 
 
-def build_cuts_from_dist_data(prop_names, values, weathering):
+def build_cuts_from_dist_data(fractions, frac_cols, values, weathering):
     '''
         Build a list of EC distillation cut objects from boiling point
         distribution data.
-        - prop_names: The list of property names
-        - values: A list of Excel cell objects representing the properties.
+        - fractions: The list of fractional values that we will build
+                     cuts for.
+        - frac_cols: The index into the values that holds the temperature
+                     associated with each fraction.
+        - values: A list of Excel cell values representing the properties.
         - weathering: The fractional oil weathering amount.
 
         Note: The labels have a bit of a problem.  Most of them are percent
@@ -70,16 +85,9 @@ def build_cuts_from_dist_data(prop_names, values, weathering):
               So it is a fraction somewhere between 95% and 100%, which we
               don't precisely know.
     '''
-    cuts = []
-    dist_data = dict(zip(prop_names, [v[0].value for v in values]))
-
-    # The only labels we care about are the percent value labels
-    for frac in ([(p / 100.0) for p in range(5, 100, 5)] + [1]):
-        label = custom_slugify('{:0}'.format(frac))
-        vapor_temp_c = dist_data[label]
-        cuts.append(build_cut_kwargs(vapor_temp_c, frac, weathering))
-
-    return [ECCut(**c) for c in cuts]
+    return [ECCut.from_row(*build_cut_args(values[col][0], frac, weathering))
+            for frac, col in zip(fractions, frac_cols)
+            if values[col][0] is not None]
 
 
 def get_cuts_from_bp_cumulative_frac(oil_columns, field_indexes, weathering):
@@ -88,22 +96,28 @@ def get_cuts_from_bp_cumulative_frac(oil_columns, field_indexes, weathering):
     props = get_oil_properties_by_category(oil_columns, field_indexes,
                                            'boiling_point_'
                                            'cumulative_weight_fraction')
-    prop_names = props.keys()
+    prop_names = tuple(props.keys())
+    rows = zip(*props.values())
+
+    temp_cols = [prop_names.index('{}'.format(t))
+                 for t in cumulative_frac_temps]
 
-    for idx, vals in enumerate(zip(*props.values())):
-        cuts_from_dist = build_cuts_from_cumulative_fraction(prop_names, vals,
+    for idx, vals in enumerate(rows):
+        cuts_from_dist = build_cuts_from_cumulative_fraction(temp_cols, vals,
                                                              weathering[idx])
         cuts.extend(cuts_from_dist)
 
-    return [c for c in cuts if c.fraction is not None]
+    return cuts
 
 
-def build_cuts_from_cumulative_fraction(prop_names, values, weathering):
+def build_cuts_from_cumulative_fraction(temp_cols, values, weathering):
     '''
         Build a list of EC distillation cut objects from cumulative weight
         fraction data.
-        - prop_names: The list of property names
-        - values: A list of Excel cell objects representing the properties.
+        - temp_cols: The index into the values that holds the fraction
+                     associated with each of our cumulative fraction
+                     temperatures.
+        - values: A list of Excel cell values representing the properties.
         - weathering: The fractional oil weathering amount.
 
         Note: The labels have a bit of a problem.  Most of them are percent
@@ -116,26 +130,14 @@ def build_cuts_from_cumulative_fraction(prop_names, values, weathering):
               So it is a fraction somewhere between 95% and 100%, which we
               don't precisely know.
     '''
-    cuts = []
-    dist_data = dict(zip(prop_names, [v[0].value for v in values]))
-
-    # The only labels we care about are the temperature labels
-    temp_values = [item
-                   for sublist in [range(40, 200, 20), range(200, 701, 50)]
-                   for item in sublist]
-
-    for temp_c in temp_values:
-        label = '{}'.format(temp_c)
-        frac = dist_data[label]
-        cuts.append(build_cut_kwargs(temp_c, frac, weathering))
-
-    return [ECCut(**c) for c in cuts]
+    return [ECCut.from_row(*build_cut_args(temp_c, values[col][0],
+                                           weathering))
+            for temp_c, col in zip(cumulative_frac_temps, temp_cols)
+            if values[col][0] is not None]
 
 
-def build_cut_kwargs(vapor_temp_c, fraction, weathering):
-    return {'vapor_temp_k': celcius_to_kelvin(vapor_temp_c),
-            'fraction': fraction,
-            'weathering': weathering}
+def build_cut_args(vapor_temp_c, fraction, weathering):
+    return celcius_to_kelvin(vapor_temp_c), fraction, weathering
 
 
 
@@ -1,9 +1,10 @@
 
+import numpy as np
+
 from ec_models import Emulsion
 
-from ec_xl_parse import get_oil_properties_by_category
+from ec_xl_parse import get_oil_properties_by_category, build_row
 from ec_oil_props import get_oil_weathering
-from ec_oil_misc import percent_to_fraction
 
 
 def get_oil_emulsions(oil_columns, field_indexes):
@@ -21,53 +22,66 @@ def get_oil_emulsions(oil_columns, field_indexes):
 
 
 def get_emulsion_age_0(oil_columns, field_indexes, weathering):
-    emulsions = []
-
     props = get_oil_properties_by_category(oil_columns, field_indexes,
                                            'emulsion_at_15_degc_'
                                            'on_the_day_of_formation_'
                                            'ests_1998_2')
-    prop_names = props.keys()
+    prop_names = tuple(props.keys())
+    rows = list(zip(*props.values()))
+    water_col = prop_names.index('water_content_w_w')
 
-    for idx, vals in enumerate(zip(*props.values())):
-        emulsion_kwargs = build_emulsion_kwargs(prop_names, vals,
-                                                weathering[idx],
-                                                273.15 + 15.0, 0.0)
-        emulsions.append(emulsion_kwargs)
+    # convert our water content percentages into fractions all at once.
+    # Empty cells become NaN values.
+    water_fractions = (np.array([vals[water_col][0] for vals in rows],
+                                dtype=np.float64) / 100.0).tolist()
 
-    return [Emulsion(**e) for e in emulsions
-            if e['water_content_fraction'] is not None]
+    emulsions = (build_emulsion_kwargs(prop_names, vals,
+                                       weathering[idx],
+                                       water_fractions[idx],
+                                       273.15 + 15.0, 0.0)
+                 for idx, vals in enumerate(rows)
+                 if not np.isnan(water_fractions[idx]))
 
+    return [Emulsion(**e) for e in emulsions]
 
-def get_emulsion_age_7(oil_columns, field_indexes, weathering):
-    emulsions = []
 
+def get_emulsion_age_7(oil_columns, field_indexes, weathering):
     props = get_oil_properties_by_category(oil_columns, field_indexes,
                                            'emulsion_at_15_degc_'
                                            'one_week_after_formation_'
                                            'ests_1998b')
-    prop_names = props.keys()
+    prop_names = tuple(props.keys())
+    rows = list(zip(*props.values()))
+    water_col = prop_names.index('water_content_w_w')
+
+    # convert our water content percentages into fractions all at once.
+    # Empty cells become NaN values.
+    water_fractions = (np.array([vals[water_col][0] for vals in rows],
+                                dtype=np.float64) / 100.0).tolist()
 
-    for idx, vals in enumerate(zip(*props.values())):
-        emulsion_kwargs = build_emulsion_kwargs(prop_names, vals,
-                                                weathering[idx],
-                                                273.15 + 15.0, 7.0)
-        emulsions.append(emulsion_kwargs)
+    emulsions = (build_emulsion_kwargs(prop_names, vals,
+                                       weathering[idx],
+                                       water_fractions[idx],
+                                       273.15 + 15.0, 7.0)
+                 for idx, vals in enumerate(rows)
+                 if not np.isnan(water_fractions[idx]))
 
-    return [Emulsion(**e) for e in emulsions
-            if e['water_content_fraction'] is not None]
+    return [Emulsion(**e) for e in emulsions]
 
 
 def build_emulsion_kwargs(prop_names, values,
-                          weathering, ref_temp_k, age_days):
+                          weathering, water_content_fraction,
+                          ref_temp_k, age_days):
     '''
         Build emulsion properties dictionary suitable to be passed in as
         keyword args.
         - prop_names: The list of property names
-        - values: A list of Excel cell objects representing the properties.
+        - values: A list of Excel cell values representing the properties.
         - weathering: The fractional oil weathering amount.
+        - water_content_fraction: The water content of the emulsion,
+                                  already converted from a percent value.
     '''
-    emul_kwargs = dict(zip(prop_names, [v[0].value for v in values]))
+    emul_kwargs = build_row(prop_names, values)
 
     emul_kwargs['weathering'] = weathering
     emul_kwargs['ref_temp_k'] = ref_temp_k
@@ -79,6 +93,6 @@ def build_emulsion_kwargs(prop_names, values,
     # emul_kwargs['tan_delta_v_e']  # already there
     # emul_kwargs['complex_viscosity_pa_s']  # already there
 
-    emul_kwargs['water_content_fraction'] = percent_to_fraction(emul_kwargs['water_content_w_w'])
+    emul_kwargs['water_content_fraction'] = water_content_fraction
 
     return emul_kwargs
@@ -18,100 +18,103 @@ def get_oil_evaporation_eqs(oil_columns, field_indexes):
                                                    field_indexes,
                                                    weathering)
 
-    evap_mass_loss1 = get_evaporation_eqs_mass_loss1(oil_columns,
-                                                     field_indexes,
-                                                     weathering)
-
-    evap_mass_loss2 = get_evaporation_eqs_mass_loss2(oil_columns,
-                                                     field_indexes,
-                                                     weathering)
+    evap_mass_loss = get_evaporation_eqs_mass_loss(oil_columns,
+                                                   field_indexes,
+                                                   weathering)
 
-    return evap_ests_1998 + evap_mass_loss1 + evap_mass_loss2
+    return evap_ests_1998 + evap_mass_loss
 
 
 def get_evaporation_eqs_ests_1998(oil_columns, field_indexes, weathering):
-    evaporation_eqs = []
-
     props = get_oil_properties_by_category(oil_columns, field_indexes,
                                            'evaporation_ests_1998_1')
-    prop_names = props.keys()
-
-    for idx, vals in enumerate(zip(*props.values())):
-        evaporation_kwargs = build_evaporation_kwargs(prop_names, vals,
-                                                      weathering[idx],
-                                                      '(A + BT) ln t',
-                                                      'for_ev_a_bt_ln_t')
-        evaporation_eqs.append(evaporation_kwargs)
+    prop_names = tuple(props.keys())
+    rows = zip(*props.values())
+    coeff_cols = get_coeff_cols(prop_names, 'for_ev_a_bt_ln_t')
 
-    return [EvaporationEq(**eq) for eq in evaporation_eqs
-            if eq['a'] is not None and eq['b'] is not None]
+    evaporation_eqs = (build_evaporation_args(vals, coeff_cols,
+                                              weathering[idx],
+                                              '(A + BT) ln t')
+                       for idx, vals in enumerate(rows)
+                       if has_coeffs(vals, coeff_cols))
 
+    return [EvaporationEq.from_row(*eq) for eq in evaporation_eqs]
 
-def get_evaporation_eqs_mass_loss1(oil_columns, field_indexes, weathering):
-    evaporation_eqs = []
 
+def get_evaporation_eqs_mass_loss(oil_columns, field_indexes, weathering):
+    '''
+        The mass loss parameters category contains the coefficients for two
+        equations, '(A + BT) sqrt(t)' and 'A + B ln (t + C)', so we get them
+        both in a single pass over the rows.
+    '''
     props = get_oil_properties_by_category(oil_columns, field_indexes,
                                            'parameters_for_'
                                            'evaporation_equation_mass_loss')
-    prop_names = props.keys()
-
-    for idx, vals in enumerate(zip(*props.values())):
-        evaporation_kwargs = build_evaporation_kwargs(prop_names, vals,
-                                                      weathering[idx],
-                                                      '(A + BT) sqrt(t)',
-                                                      'for_ev_a_bt_sqrt_t')
-        evaporation_eqs.append(evaporation_kwargs)
-
-    return [EvaporationEq(**eq) for eq in evaporation_eqs
-            if eq['a'] is not None and eq['b'] is not None]
+    prop_names = tuple(props.keys())
+    rows = zip(*props.values())
+    sqrt_coeff_cols = get_coeff_cols(prop_names, 'for_ev_a_bt_sqrt_t')
+    ln_coeff_cols = get_coeff_cols(prop_names, 'for_ev_a_b_ln_t_c')
 
+    sqrt_eqs = []
+    ln_eqs = []
 
-def get_evaporation_eqs_mass_loss2(oil_columns, field_indexes, weathering):
-    evaporation_eqs = []
-
-    props = get_oil_properties_by_category(oil_columns, field_indexes,
-                                           'parameters_for_'
-                                           'evaporation_equation_mass_loss')
-    prop_names = props.keys()
+    for idx, vals in enumerate(rows):
+        if has_coeffs(vals, sqrt_coeff_cols):
+            sqrt_eqs.append(build_evaporation_args(vals, sqrt_coeff_cols,
+                                                   weathering[idx],
+                                                   '(A + BT) sqrt(t)'))
 
-    for idx, vals in enumerate(zip(*props.values())):
-        evaporation_kwargs = build_evaporation_kwargs(prop_names, vals,
-                                                      weathering[idx],
-                                                      'A + B ln (t + C)',
-                                                      'for_ev_a_b_ln_t_c')
-        evaporation_eqs.append(evaporation_kwargs)
+        if has_coeffs(vals, ln_coeff_cols):
+            ln_eqs.append(build_evaporation_args(vals, ln_coeff_cols,
+                                                 weathering[idx],
+                                                 'A + B ln (t + C)'))
 
-    return [EvaporationEq(**eq) for eq in evaporation_eqs
-            if eq['a'] is not None and eq['b'] is not None]
+    return [EvaporationEq.from_row(*eq) for eq in sqrt_eqs + ln_eqs]
 
 
-def build_evaporation_kwargs(prop_names, values, weathering,
-                             equation, coeff_label):
+def get_coeff_cols(prop_names, coeff_label):
     '''
-        Build evaporation equation properties dictionary suitable to be
-        passed in as keyword args.
+        Get the indexes of the A, B, and optionally C, coefficient properties
+        for an evaporation equation.
         - prop_names: The list of property names
-        - values: A list of Excel cell objects representing the properties.
-        - weathering: The fractional oil weathering amount.
         - coeff_label: the property label containing our coefficients.  This
                        is a suffix that we will prepend with the coefficient
                        we would like to get.
-    '''
-    evap_kwargs = dict(zip(prop_names, [v[0].value for v in values]))
-
-    evap_kwargs['weathering'] = weathering
-    evap_kwargs['equation'] = equation
 
-    evap_kwargs['a'] = evap_kwargs['a_{}'.format(coeff_label)]
-    evap_kwargs['b'] = evap_kwargs['b_{}'.format(coeff_label)]
+        Note: The C index will be None if the equation has no C coefficient.
+    '''
+    a_col = prop_names.index('a_{}'.format(coeff_label))
+    b_col = prop_names.index('b_{}'.format(coeff_label))
 
-    if 'c_{}'.format(coeff_label) in evap_kwargs:
-        evap_kwargs['c'] = evap_kwargs['c_{}'.format(coeff_label)]
+    c_label = 'c_{}'.format(coeff_label)
+    c_col = prop_names.index(c_label) if c_label in prop_names else None
 
-    return evap_kwargs
+    return a_col, b_col, c_col
 
 
+def has_coeffs(values, coeff_cols):
+    '''
+        An evaporation equation is only usable if we have both its
+        A and B coefficients.
+    '''
+    a_col, b_col, _c_col = coeff_cols
 
+    return values[a_col][0] is not None and values[b_col][0] is not None
 
 
+def build_evaporation_args(values, coeff_cols, weathering, equation):
+    '''
+        Build evaporation equation properties tuple suitable to be
+        passed in as positional args to EvaporationEq.from_row().
+        - values: A list of Excel cell values representing the properties.
+        - coeff_cols: The indexes of the A, B, and C coefficient values.
+        - weathering: The fractional oil weathering amount.
+        - equation: The evaporation equation that the coefficients apply to.
+    '''
+    a_col, b_col, c_col = coeff_cols
 
+    return (values[a_col][0],
+            values[b_col][0],
+            values[c_col][0] if c_col is not None else None,
+            equation,
+            weathering)
@@ -1,9 +1,15 @@
 
+from collections import namedtuple
+
 from ec_models import FlashPoint
 
-from ec_xl_parse import get_oil_properties_by_category
+from ec_xl_parse import get_oil_properties_by_name
 from ec_oil_props import get_oil_weathering
-from ec_oil_misc import get_min_temp, get_max_temp
+from ec_oil_misc import get_min_max_temp
+
+# lightweight carrier for the flash point properties of a single row
+FlashPointRow = namedtuple('FlashPointRow',
+                           ('min_temp_k', 'max_temp_k', 'weathering'))
 
 
 def get_oil_flash_points(oil_columns, field_indexes):
@@ -22,34 +28,24 @@ def get_oil_flash_points(oil_columns, field_indexes):
 
 
 def get_flash_points_by_weathering(oil_columns, field_indexes, weathering):
-    flash_points = []
-
-    props = get_oil_properties_by_category(oil_columns, field_indexes,
-                                           'flash_point_c')
-    prop_names = props.keys()
+    cells = get_oil_properties_by_name(oil_columns, field_indexes,
+                                       'flash_point_c', 'flash_point')
 
-    for idx, vals in enumerate(zip(*props.values())):
-        flash_point_obj = build_flash_point_kwargs(prop_names, vals,
-                                                   weathering[idx])
-        flash_points.append(flash_point_obj)
+    flash_points = (build_flash_point_args(c[0], weathering[idx])
+                    for idx, c in enumerate(cells)
+                    if c[0] is not None)
 
-    return [FlashPoint(**f) for f in flash_points
-            if f['min_temp_k'] is not None or f['max_temp_k'] is not None]
+    return [FlashPoint.from_row(*p) for p in flash_points
+            if p.min_temp_k is not None or p.max_temp_k is not None]
 
 
-def build_flash_point_kwargs(prop_names, values, weathering):
+def build_flash_point_args(flash_point, weathering):
     '''
-        Build a flash point properties dictionary suitable to be passed in as
-        keyword args.
-        - prop_names: The list of property names
-        - values: A list of Excel cell objects representing the properties.
+        Build a flash point properties row suitable to be passed in as
+        positional args to FlashPoint.from_row().
+        - flash_point: The flash point value of the Excel cell.
         - weathering: The fractional oil weathering amount.
     '''
-    flash_point_obj = dict(zip(prop_names, [v[0].value for v in values]))
-
-    flash_point_obj['weathering'] = weathering
-
-    flash_point_obj['min_temp_k'] = get_min_temp(flash_point_obj['flash_point'])
-    flash_point_obj['max_temp_k'] = get_max_temp(flash_point_obj['flash_point'])
+    min_temp_k, max_temp_k = get_min_max_temp(flash_point)
 
-    return flash_point_obj
+    return FlashPointRow(min_temp_k, max_temp_k, weathering)
@@ -1,9 +1,21 @@
+from collections import namedtuple
 
 from ec_models import InterfacialTension
 
 from ec_xl_parse import get_oil_properties_by_category
 from ec_oil_props import get_oil_weathering
 
+# lightweight carrier for the tension properties of a single row
+TensionRow = namedtuple('TensionRow',
+                        ('interface', 'n_m', 'ref_temp_k', 'weathering'))
+
+# The property label (formatted with a temperature) and interface of each
+# tension measured at a temperature.
+tension_labels = (('surface_tension_{}_c_oil_air', 'air'),
+                  ('interfacial_tension_{}_c_oil_water', 'water'),
+                  ('interfacial_tension_{}_c_oil_salt_water_3_3_nacl',
+                   'seawater'))
+
 
 def get_oil_interfacial_tensions(oil_columns, field_indexes):
     '''
@@ -15,13 +27,10 @@ def get_oil_interfacial_tensions(oil_columns, field_indexes):
         I still think it could have been organized more orthogonally.
     '''
     weathering = get_oil_weathering(oil_columns, field_indexes)
-    tensions_at_0c = get_oil_tensions_at_0c(oil_columns,
-                                            field_indexes,
-                                            weathering)
-
-    tensions_at_5c = get_oil_tensions_at_5c(oil_columns,
-                                            field_indexes,
-                                            weathering)
+    (tensions_at_0c,
+     tensions_at_5c) = get_oil_tensions_at_0_and_5c(oil_columns,
+                                                    field_indexes,
+                                                    weathering)
 
     tensions_at_15c = get_oil_tensions_at_15c(oil_columns,
                                               field_indexes,
@@ -31,136 +40,83 @@ def get_oil_interfacial_tensions(oil_columns, field_indexes):
 
 
 def get_oil_tensions_at_15c(oil_columns, field_indexes, weathering):
-    tensions = []
-
     props = get_oil_properties_by_category(oil_columns, field_indexes,
                                            'surface_interfacial_tension_'
                                            'at_15_c_mn_m_or_dynes_cm')
-    prop_names = props.keys()
-
-    for idx, vals in enumerate(zip(*props.values())):
-        tension_obj = build_tension_kwargs(prop_names, vals,
-                                           'surface_tension_15_c_oil_air',
-                                           weathering[idx],
-                                           273.15 + 15.0, 'air')
-        tensions.append(tension_obj)
+    prop_names = tuple(props.keys())
+    rows = zip(*props.values())
+    tension_cols = get_tension_cols(prop_names, 15)
 
-        tension_obj = build_tension_kwargs(prop_names, vals,
-                                           'interfacial_tension_'
-                                           '15_c_oil_water',
-                                           weathering[idx],
-                                           273.15 + 15.0, 'water')
-        tensions.append(tension_obj)
+    tensions = (build_tension_args(vals[col][0], weathering[idx],
+                                   273.15 + 15.0, interface)
+                for idx, vals in enumerate(rows)
+                for col, interface in tension_cols)
 
-        tension_obj = build_tension_kwargs(prop_names, vals,
-                                           'interfacial_tension_'
-                                           '15_c_oil_salt_water_3_3_nacl',
-                                           weathering[idx],
-                                           273.15 + 15.0, 'seawater')
-        tensions.append(tension_obj)
+    return [InterfacialTension.from_row(*t) for t in tensions
+            if t.n_m is not None and t.n_m != 0.0]
 
-    return [InterfacialTension(**t) for t in tensions
-            if t['n_m'] not in (None, 0.0)]
 
-
-def get_oil_tensions_at_0c(oil_columns, field_indexes, weathering):
-    tensions = []
+def get_oil_tensions_at_0_and_5c(oil_columns, field_indexes, weathering):
+    '''
+        The tensions at 0C and 5C share a category, so we get them both
+        in a single pass over the rows.
+    '''
+    tensions_at_0c = []
+    tensions_at_5c = []
 
     props = get_oil_properties_by_category(oil_columns, field_indexes,
                                            'surface_interfacial_tension_'
                                            'at_0_5_c_mn_m_or_dynes_cm')
-    prop_names = props.keys()
+    prop_names = tuple(props.keys())
+    rows = zip(*props.values())
+    tension_cols_0c = get_tension_cols(prop_names, 0)
+    tension_cols_5c = get_tension_cols(prop_names, 5)
 
-    for idx, vals in enumerate(zip(*props.values())):
-        tension_obj = build_tension_kwargs(prop_names, vals,
-                                           'surface_tension_0_c_oil_air',
-                                           weathering[idx],
-                                           273.15, 'air')
-        tensions.append(tension_obj)
+    for idx, vals in enumerate(rows):
+        for col, interface in tension_cols_0c:
+            t = build_tension_args(vals[col][0], weathering[idx],
+                                   273.15, interface)
+            if t.n_m is not None and t.n_m != 0.0:
+                tensions_at_0c.append(InterfacialTension.from_row(*t))
 
-        tension_obj = build_tension_kwargs(prop_names, vals,
-                                           'interfacial_tension_0_c_oil_water',
-                                           weathering[idx],
-                                           273.15, 'water')
-        tensions.append(tension_obj)
+        for col, interface in tension_cols_5c:
+            t = build_tension_args(vals[col][0], weathering[idx],
+                                   273.15 + 5.0, interface)
+            if t.n_m is not None and t.n_m != 0.0:
+                tensions_at_5c.append(InterfacialTension.from_row(*t))
 
-        tension_obj = build_tension_kwargs(prop_names, vals,
-                                           'interfacial_tension_'
-                                           '0_c_oil_salt_water_3_3_nacl',
-                                           weathering[idx],
-                                           273.15, 'seawater')
-        tensions.append(tension_obj)
+    return tensions_at_0c, tensions_at_5c
 
-    return [InterfacialTension(**t) for t in tensions
-            if t['n_m'] not in (None, 0.0)]
 
+def get_tension_cols(prop_names, temp_c):
+    '''
+        Get the indexes of the tension properties measured at a temperature,
+        along with the interface that each of them applies to.
+        - prop_names: The list of property names
+        - temp_c: The measurement temperature in degrees Celcius.
+    '''
+    return [(prop_names.index(label.format(temp_c)), interface)
+            for label, interface in tension_labels]
 
-def get_oil_tensions_at_5c(oil_columns, field_indexes, weathering):
-    tensions = []
 
-    props = get_oil_properties_by_category(oil_columns, field_indexes,
-                                           'surface_interfacial_tension_'
-                                           'at_0_5_c_mn_m_or_dynes_cm')
-    prop_names = props.keys()
-
-    for idx, vals in enumerate(zip(*props.values())):
-        tension_obj = build_tension_kwargs(prop_names, vals,
-                                           'surface_tension_5_c_oil_air',
-                                           weathering[idx],
-                                           273.15 + 5.0, 'air')
-        tensions.append(tension_obj)
-
-        tension_obj = build_tension_kwargs(prop_names, vals,
-                                           'interfacial_tension_5_c_oil_water',
-                                           weathering[idx],
-                                           273.15 + 5.0, 'water')
-        tensions.append(tension_obj)
-
-        tension_obj = build_tension_kwargs(prop_names, vals,
-                                           'interfacial_tension_'
-                                           '5_c_oil_salt_water_3_3_nacl',
-                                           weathering[idx],
-                                           273.15 + 5.0, 'seawater')
-        tensions.append(tension_obj)
-
-    return [InterfacialTension(**t) for t in tensions
-            if t['n_m'] not in (None, 0.0)]
-
-
-def build_tension_kwargs(prop_names, values, ift_name,
-                         weathering, ref_temp_k, interface):
+def build_tension_args(tension, weathering, ref_temp_k, interface):
     '''
-        Build a surface tension dictionary suitable to be passed in as
-        keyword args.
-        - prop_names: The list of property names
-        - values: A list of Excel cell objects representing the properties.
-        - ift_name: The interfacial tension property name.  This property will
-                    need to be converted to N/m, and renamed to 'n_m'.
+        Build a tension properties row suitable to be passed in as
+        positional args to InterfacialTension.from_row().
+        - tension: The tension value (mN/m) of the Excel cell.
         - weathering: The fractional oil weathering amount.
         - ref_temp_k: The temperature of the oil at measurement time.
         - interface: The type of substance interfacing the oil.
     '''
-    tension_obj = dict(zip(prop_names, [v[0].value for v in values]))
-
-    # add some properties to the oil that we expect
-    add_tension_kwargs(tension_obj, ref_temp_k, weathering, interface)
-
-    tension_obj['n_m'] = convert_to_nm(tension_obj[ift_name])
-
-    return tension_obj
-
-
-def add_tension_kwargs(tension_obj, ref_temp_k, weathering, interface):
-    tension_obj['ref_temp_k'] = ref_temp_k
-    tension_obj['weathering'] = weathering
-    tension_obj['interface'] = interface
+    return TensionRow(interface, convert_to_nm(tension), ref_temp_k,
+                      weathering)
 
 
 def convert_to_nm(mn_per_m):
     '''
         Convert mN/m (dynes/cm) into N/m or return None value
     '''
-    if isinstance(mn_per_m, (int, long, float)):
+    if isinstance(mn_per_m, (int, float)):
         return mn_per_m * 1e-3
     else:
         return None
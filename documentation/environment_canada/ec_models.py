@@ -11,7 +11,28 @@ from sqlalchemy import (Column,
 from oil_library.models import Base
 
 
-class InterfacialTension(Base):
+class ECModelMixin(object):
+    '''
+        Construction helpers shared by our Environment Canada models.
+
+        __init__() matches its keyword args against the names of our table
+        columns, which we only gather once per class.  The parsers build
+        these objects in bulk from spreadsheet rows, so most models also have
+        a from_row() classmethod that takes their fields positionally and
+        sets them directly, bypassing the keyword argument matching.
+    '''
+    @classmethod
+    def column_names(cls):
+        names = cls.__dict__.get('_column_names')
+
+        if names is None:
+            names = frozenset(c.name for c in cls.__table__.columns)
+            cls._column_names = names
+
+        return names
+
+
+class InterfacialTension(ECModelMixin, Base):
     __tablename__ = 'interfacial_tensions'
     id = Column(Integer, primary_key=True)
     imported_record_id = Column(Integer, ForeignKey('imported_records.id'))
@@ -24,22 +45,32 @@ class InterfacialTension(Base):
     weathering = Column(Float(53))
 
     def __init__(self, **kwargs):
-        for a, v in kwargs.iteritems():
-            if (a in self.columns):
-                setattr(self, a, v)
+        for a in self.column_names().intersection(kwargs):
+            setattr(self, a, kwargs[a])
 
         if 'weathering' not in kwargs:
             # sqlalchemy column defaults only work upon insert/update, so we
             # have to put an explicit default here.
             self.weathering = 0.0
 
+    @classmethod
+    def from_row(cls, interface, n_m, ref_temp_k, weathering):
+        'Create an interfacial tension from its row values'
+        obj = cls()
+        obj.interface = interface
+        obj.n_m = n_m
+        obj.ref_temp_k = ref_temp_k
+        obj.weathering = weathering
+
+        return obj
+
     def __repr__(self):
         return ('<InterfacialTension({0.n_m} N/m at {0.ref_temp_k}K, '
                 'if={0.interface})>'
                 .format(self))
 
 
-class FlashPoint(Base):
+class FlashPoint(ECModelMixin, Base):
     __tablename__ = 'flash_points'
     id = Column(Integer, primary_key=True)
     imported_record_id = Column(Integer, ForeignKey('imported_records.id'))
@@ -50,15 +81,24 @@ class FlashPoint(Base):
     weathering = Column(Float(53))
 
     def __init__(self, **kwargs):
-        for a, v in kwargs.iteritems():
-            if (a in self.columns):
-                setattr(self, a, v)
+        for a in self.column_names().intersection(kwargs):
+            setattr(self, a, kwargs[a])
 
         if 'weathering' not in kwargs:
             # sqlalchemy column defaults only work upon insert/update, so we
             # have to put an explicit default here.
             self.weathering = 0.0
 
+    @classmethod
+    def from_row(cls, min_temp_k, max_temp_k, weathering):
+        'Create a flash point from its row values'
+        obj = cls()
+        obj.min_temp_k = min_temp_k
+        obj.max_temp_k = max_temp_k
+        obj.weathering = weathering
+
+        return obj
+
     def __repr__(self):
         return ('<FlashPoint('
                 'min={0.min_temp_k}K, '
@@ -67,7 +107,7 @@ class FlashPoint(Base):
                 .format(self))
 
 
-class PourPoint(Base):
+class PourPoint(ECModelMixin, Base):
     __tablename__ = 'pour_points'
     id = Column(Integer, primary_key=True)
     imported_record_id = Column(Integer, ForeignKey('imported_records.id'))
@@ -78,15 +118,24 @@ class PourPoint(Base):
     weathering = Column(Float(53))
 
     def __init__(self, **kwargs):
-        for a, v in kwargs.iteritems():
-            if (a in self.columns):
-                setattr(self, a, v)
+        for a in self.column_names().intersection(kwargs):
+            setattr(self, a, kwargs[a])
 
         if 'weathering' not in kwargs:
             # sqlalchemy column defaults only work upon insert/update, so we
             # have to put an explicit default here.
             self.weathering = 0.0
 
+    @classmethod
+    def from_row(cls, min_temp_k, max_temp_k, weathering):
+        'Create a pour point from its row values'
+        obj = cls()
+        obj.min_temp_k = min_temp_k
+        obj.max_temp_k = max_temp_k
+        obj.weathering = weathering
+
+        return obj
+
     def __repr__(self):
         return ('<PourPoint('
                 'min={0.min_temp_k}K, '
@@ -95,7 +144,7 @@ class PourPoint(Base):
                 .format(self))
 
 
-class ECCut(Base):
+class ECCut(ECModelMixin, Base):
     '''
         Distillation cut object that has been tailored to Environment
         Canada's data.  Mostly the same, but with weathering added.
@@ -111,15 +160,24 @@ class ECCut(Base):
     weathering = Column(Float(53))
 
     def __init__(self, **kwargs):
-        for a, v in kwargs.iteritems():
-            if (a in self.columns):
-                setattr(self, a, v)
+        for a in self.column_names().intersection(kwargs):
+            setattr(self, a, kwargs[a])
 
         if 'weathering' not in kwargs:
             # sqlalchemy column defaults only work upon insert/update, so we
             # have to put an explicit default here.
             self.weathering = 0.0
 
+    @classmethod
+    def from_row(cls, vapor_temp_k, fraction, weathering):
+        'Create a cut from its row values'
+        obj = cls()
+        obj.vapor_temp_k = vapor_temp_k
+        obj.fraction = fraction
+        obj.weathering = weathering
+
+        return obj
+
     def __repr__(self):
         lt = '{0}K'.format(self.liquid_temp_k) if self.liquid_temp_k else None
         vt = '{0}K'.format(self.vapor_temp_k) if self.vapor_temp_k else None
@@ -128,7 +186,7 @@ class ECCut(Base):
                 .format(lt, vt, self.fraction, self.weathering))
 
 
-class Adhesion(Base):
+class Adhesion(ECModelMixin, Base):
     __tablename__ = 'adhesions'
     id = Column(Integer, primary_key=True)
     imported_record_id = Column(Integer, ForeignKey('imported_records.id'))
@@ -138,21 +196,29 @@ class Adhesion(Base):
     weathering = Column(Float(53))
 
     def __init__(self, **kwargs):
-        for a, v in kwargs.iteritems():
-            if (a in self.columns):
-                setattr(self, a, v)
+        for a in self.column_names().intersection(kwargs):
+            setattr(self, a, kwargs[a])
 
         if 'weathering' not in kwargs:
             # sqlalchemy column defaults only work upon insert/update, so we
             # have to put an explicit default here.
             self.weathering = 0.0
 
+    @classmethod
+    def from_row(cls, kg_m_2, weathering):
+        'Create an adhesion from its row values'
+        obj = cls()
+        obj.kg_m_2 = kg_m_2
+        obj.weathering = weathering
+
+        return obj
+
     def __repr__(self):
         return ('<Adhesion({0.kg_m_2} kg/m^2, weathering={0.weathering})>'
                 .format(self))
 
 
-class EvaporationEq(Base):
+class EvaporationEq(ECModelMixin, Base):
     __tablename__ = 'evaporation_eqs'
     id = Column(Integer, primary_key=True)
     imported_record_id = Column(Integer, ForeignKey('imported_records.id'))
@@ -169,18 +235,25 @@ class EvaporationEq(Base):
     weathering = Column(Float(53))
 
     def __init__(self, **kwargs):
-        for a, v in kwargs.iteritems():
-            if (a in self.columns):
-                setattr(self, a, v)
+        for a in self.column_names().intersection(kwargs):
+            setattr(self, a, kwargs[a])
 
         if 'weathering' not in kwargs:
             # sqlalchemy column defaults only work upon insert/update, so we
             # have to put an explicit default here.
             self.weathering = 0.0
 
-        self.alg = {'(A + BT) ln t': self.calculate_ests_1998,
-                    '(A + BT) sqrt(t)': self.calculate_mass_loss1,
-                    'A + B ln (t + C)': self.calculate_mass_loss2}
+    @classmethod
+    def from_row(cls, a, b, c, equation, weathering):
+        'Create an evaporation equation from its row values'
+        obj = cls()
+        obj.a = a
+        obj.b = b
+        obj.c = c
+        obj.equation = equation
+        obj.weathering = weathering
+
+        return obj
 
     def __repr__(self):
         return ('<EvaporationEq(a={0.a}, b={0.b}, c={0.c}, '
@@ -189,7 +262,12 @@ class EvaporationEq(Base):
                 .format(self))
 
     def calculate(self, t, T=None):
-        return self.alg[self.equation](t, T)
+        '''
+            Calculate the evaporative loss at time t.  t may be a numpy array
+            of times, in which case the whole series is evaluated in a single
+            pass through the numpy ufuncs.
+        '''
+        return self.alg[self.equation](self, t, T)
 
     def calculate_ests_1998(self, t, T):
         return (self.a + self.b * T) * np.log(t)
@@ -200,8 +278,17 @@ class EvaporationEq(Base):
     def calculate_mass_loss2(self, t, T):
         return self.a + self.b * np.log(t + self.c)
 
+    # The algorithm used for each equation.  This is kept at the class level
+    # so that we don't carry a dict of bound methods around in every
+    # instance, and so that it is available for objects that were loaded
+    # from the database (which don't go through __init__()).
+    # We hold the plain functions, so calculate() doesn't need a getattr().
+    alg = {'(A + BT) ln t': calculate_ests_1998,
+           '(A + BT) sqrt(t)': calculate_mass_loss1,
+           'A + B ln (t + C)': calculate_mass_loss2}
+
 
-class Emulsion(Base):
+class Emulsion(ECModelMixin, Base):
     __tablename__ = 'emulsions'
     id = Column(Integer, primary_key=True)
     imported_record_id = Column(Integer, ForeignKey('imported_records.id'))
@@ -219,9 +306,8 @@ class Emulsion(Base):
     weathering = Column(Float(53))
 
     def __init__(self, **kwargs):
-        for a, v in kwargs.iteritems():
-            if (a in self.columns):
-                setattr(self, a, v)
+        for a in self.column_names().intersection(kwargs):
+            setattr(self, a, kwargs[a])
 
         if 'weathering' not in kwargs:
             # sqlalchemy column defaults only work upon insert/update, so we
@@ -241,10 +327,3 @@ class Emulsion(Base):
                 'weathering={0.weathering})>'
                 .format(self))
 
-
-
-
-
-
-
-
@@ -1,39 +1,35 @@
+from builtins import str
 
+import re
 
-def get_min_temp(temp_c):
-    '''
-        calculate the pour point minimum value from the Excel content
-        - Excel float content is in degrees Celcius
-
-        - if we have no preceding operater,     then min = the value.
-        - if we have a '>' preceding the float, then min = the value.
-        - if we have a '<' preceding the float, then min = None.
-        - otherwise,                                 min = None
-    '''
-    op, value = get_op_and_value(temp_c)
-
-    if op == '<':
-        value = None
-
-    return celcius_to_kelvin(value)
+# an optional '<' or '>' operator, followed by a numeric value
+_op_and_value_re = re.compile(r'\s*([<>]?)\s*'
+                              r'(-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)')
 
 
-def get_max_temp(temp_c):
+def get_min_max_temp(temp_c):
     '''
-        calculate the flash point minimum value from the Excel content
+        calculate the flash/pour point minimum and maximum values from the
+        Excel content.  Both come from the same content, so we only parse
+        it once.
         - Excel float content is in degrees Celcius
 
-        - if we have no preceding operater,     then max = the value.
-        - if we have a '<' preceding the float, then max = the value.
-        - if we have a '>' preceding the float, then max = None.
-        - otherwise,                                 max = None
+        - if we have no preceding operater,     then min = max = the value.
+        - if we have a '>' preceding the float, then min = the value,
+                                                     max = None.
+        - if we have a '<' preceding the float, then min = None,
+                                                     max = the value.
+        - otherwise,                                 min = max = None
     '''
     op, value = get_op_and_value(temp_c)
+    value = celcius_to_kelvin(value)
 
-    if op == '>':
-        value = None
-
-    return celcius_to_kelvin(value)
+    if op == '<':
+        return None, value
+    elif op == '>':
+        return value, None
+    else:
+        return value, value
 
 
 def get_op_and_value(value_in):
@@ -45,18 +41,17 @@ def get_op_and_value(value_in):
         and a float value.
         Most of the time, it is a float value, in which we just interpret it
         with no associated operator.
+        Any content that we can't interpret (i.e. 'No Flash') has no value.
     '''
-    op = None
+    if isinstance(value_in, (int, float)):
+        return None, value_in
+    elif isinstance(value_in, str):
+        m = _op_and_value_re.match(value_in)
 
-    if isinstance(value_in, (int, long, float)):
-        value = value_in
-    elif isinstance(value_in, (str, unicode)):
-        op = value_in[0].encode('utf8')
-        value = float(value_in[1:])
-    else:
-        value = None
+        if m is not None:
+            return m.group(1) or None, float(m.group(2))
 
-    return op, value
+    return None, None
 
 
 def celcius_to_kelvin(temp_c):
@@ -1,15 +1,34 @@
 
+from operator import itemgetter
+
 from ec_xl_parse import get_oil_properties_by_name
 
+# weathering amounts for the most recently parsed oil columns.
+_weathering_cache = {'oil_columns': None,
+                     'field_indexes': None,
+                     'weathering': None}
+
 
 def get_oil_weathering(oil_columns, field_indexes):
-    cells = get_oil_properties_by_name(oil_columns, field_indexes,
-                                       None, 'weathered')
-    return [c[0].value for c in cells]
+    '''
+        Every one of our oil property getters needs the weathering amounts
+        of the oil columns, so we memoize them for the most recently used
+        oil columns.  The returned list is shared, and should not be modified.
+    '''
+    if (_weathering_cache['oil_columns'] is not oil_columns or
+            _weathering_cache['field_indexes'] is not field_indexes):
+        cells = get_oil_properties_by_name(oil_columns, field_indexes,
+                                           None, 'weathered')
+
+        _weathering_cache['oil_columns'] = oil_columns
+        _weathering_cache['field_indexes'] = field_indexes
+        _weathering_cache['weathering'] = list(map(itemgetter(0), cells))
+
+    return _weathering_cache['weathering']
 
 
 def get_oil_reference(oil_columns, field_indexes):
     cells = get_oil_properties_by_name(oil_columns, field_indexes,
                                        None, 'reference')
-    return ' '.join([c[0].value for c in cells
-                     if c[0].value is not None])
+    return ' '.join([c[0] for c in cells
+                     if c[0] is not None])
@@ -1,7 +1,9 @@
 
+import numpy as np
+
 from oil_library.models import DVis
 
-from ec_xl_parse import get_oil_properties_by_category
+from ec_xl_parse import get_oil_properties_as_array
 from ec_oil_props import get_oil_weathering
 from ec_oil_misc import get_op_and_value
 
@@ -13,13 +15,10 @@ def get_oil_viscosities(oil_columns, field_indexes):
         I dunno, I would have organized the data in a more orthogonal way.
     '''
     weathering = get_oil_weathering(oil_columns, field_indexes)
-    viscosities_at_0c = get_oil_viscosities_at_0c(oil_columns,
-                                                  field_indexes,
-                                                  weathering)
-
-    viscosities_at_5c = get_oil_viscosities_at_5c(oil_columns,
-                                                  field_indexes,
-                                                  weathering)
+    (viscosities_at_0c,
+     viscosities_at_5c) = get_oil_viscosities_at_0_and_5c(oil_columns,
+                                                          field_indexes,
+                                                          weathering)
 
     viscosities_at_15c = get_oil_viscosities_at_15c(oil_columns,
                                                     field_indexes,
@@ -29,79 +28,66 @@ def get_oil_viscosities(oil_columns, field_indexes):
 
 
 def get_oil_viscosities_at_15c(oil_columns, field_indexes, weathering):
-    viscosities = []
-
-    props = get_oil_properties_by_category(oil_columns, field_indexes,
-                                           'viscosity_at_15_c_mpa_s')
-    prop_names = props.keys()
-
-    for idx, vals in enumerate(zip(*props.values())):
-        dvis_kwargs = build_dvis_kwargs(prop_names, vals,
-                                        'viscosity_at_15_c_mpa_s',
-                                        weathering[idx],
-                                        273.15 + 15.0)
-
-        viscosities.append(dvis_kwargs)
-
-    return [DVis(**v) for v in viscosities
-            if v['kg_ms'] not in (None, 0.0)]
-
-
-def get_oil_viscosities_at_0c(oil_columns, field_indexes, weathering):
-    viscosities = []
-
-    props = get_oil_properties_by_category(oil_columns, field_indexes,
-                                           'viscosity_at_0_5_c_mpa_s')
-    prop_names = props.keys()
+    prop_names, values = get_oil_properties_as_array(oil_columns,
+                                                     field_indexes,
+                                                     'viscosity_at_15_c_mpa_s')
 
-    for idx, vals in enumerate(zip(*props.values())):
-        dvis_kwargs = build_dvis_kwargs(prop_names, vals,
-                                        'viscosity_at_0_c_mpa_s',
-                                        weathering[idx],
-                                        273.15)
+    dvis_idx = prop_names.index('viscosity_at_15_c_mpa_s')
+    kg_ms = get_dvis_kg_ms(values[dvis_idx, :, 0])
 
-        viscosities.append(dvis_kwargs)
+    return build_viscosities(kg_ms, weathering, 273.15 + 15.0)
 
-    return [DVis(**v) for v in viscosities
-            if v['kg_ms'] not in (None, 0.0)]
 
+def get_oil_viscosities_at_0_and_5c(oil_columns, field_indexes, weathering):
+    '''
+        The viscosities at 0C and 5C share a category, so we get them both
+        from a single extraction of the category values.
+    '''
+    prop_names, values = get_oil_properties_as_array(oil_columns,
+                                                     field_indexes,
+                                                     'viscosity_at_'
+                                                     '0_5_c_mpa_s')
 
-def get_oil_viscosities_at_5c(oil_columns, field_indexes, weathering):
-    viscosities = []
-
-    props = get_oil_properties_by_category(oil_columns, field_indexes,
-                                           'viscosity_at_0_5_c_mpa_s')
-    prop_names = props.keys()
-
-    for idx, vals in enumerate(zip(*props.values())):
-        dvis_kwargs = build_dvis_kwargs(prop_names, vals,
-                                        'viscosity_at_5_c_mpa_s',
-                                        weathering[idx],
-                                        273.15 + 5.0)
-
-        viscosities.append(dvis_kwargs)
+    dvis_idx_0c = prop_names.index('viscosity_at_0_c_mpa_s')
+    dvis_idx_5c = prop_names.index('viscosity_at_5_c_mpa_s')
+    kg_ms_0c = get_dvis_kg_ms(values[dvis_idx_0c, :, 0])
+    kg_ms_5c = get_dvis_kg_ms(values[dvis_idx_5c, :, 0])
 
-    return [DVis(**v) for v in viscosities
-            if v['kg_ms'] not in (None, 0.0)]
+    return (build_viscosities(kg_ms_0c, weathering, 273.15),
+            build_viscosities(kg_ms_5c, weathering, 273.15 + 5.0))
 
 
-def build_dvis_kwargs(prop_names, values, dvis_label, weathering, ref_temp_k):
+def get_dvis_kg_ms(viscosities):
     '''
-        Build the argument list for creating a DVis database object.  The data
-        is mostly what we expect, with only a few deviations.
+        Get the dynamic viscosities in kg/ms from the Excel content.
+        - viscosities: The viscosity values (mPa.s) of the Excel cells,
+                       one per weathered sample.
+
+        The cells are parsed individually, but the unit conversion is done
+        on the whole array.  Missing values become NaN.
 
         Note: Sometimes there is a greater than ('>') indication for a
               viscosity value.  I don't really know what else to do in
               this case but parse the float value and ignore the operator.
     '''
-    dvis_kwargs = dict(zip(prop_names, [v[0].value for v in values]))
+    mpa_s = np.array([get_op_and_value(v)[1] for v in viscosities],
+                     dtype=np.float64)
 
-    dvis_kwargs['weathering'] = weathering
+    return mpa_s * 1e-3
 
-    dvis_kwargs['ref_temp_k'] = ref_temp_k
 
-    _op, dvis_kwargs['kg_ms'] = get_op_and_value(dvis_kwargs[dvis_label])
-    if dvis_kwargs['kg_ms'] is not None:
-        dvis_kwargs['kg_ms'] *= 1e-3
+def build_viscosities(kg_ms, weathering, ref_temp_k):
+    '''
+        Build the DVis objects for the weathered samples that have a
+        viscosity value.
+        - kg_ms: The array of viscosity values, one per weathered sample.
+        - weathering: The fractional oil weathering amounts.
+        - ref_temp_k: The temperature of the oil at measurement time.
+    '''
+    has_value = np.isfinite(kg_ms) & (kg_ms != 0.0)
+    kg_ms = kg_ms.tolist()
 
-    return dvis_kwargs
+    return [DVis(kg_ms=kg_ms[i],
+                 ref_temp_k=ref_temp_k,
+                 weathering=weathering[i])
+            for i in np.flatnonzero(has_value)]
@@ -1,10 +1,33 @@
+from builtins import str
 
 from collections import defaultdict
+from operator import itemgetter
+
+import numpy as np
 
 from slugify import Slugify
 
-custom_slugify = Slugify(to_lower=True)
-custom_slugify.separator = '_'
+custom_slugify = Slugify(to_lower=True, separator='_')
+
+# slugified names, keyed by their Excel content.  A sheet only has a few
+# dozen distinct category and property names, repeated over many rows.
+_slug_cache = {}
+
+# memoized category properties for the most recently parsed oil columns.
+# We hold on to the objects themselves (and not just their id()) so that
+# they can't be garbage collected and have their id reused by another oil.
+_props_cache = {'oil_columns': None,
+                'field_indexes': None,
+                'categories': {}}
+
+# the fields of each category, for the most recently used field indexes.
+_category_cache = {'field_indexes': None,
+                   'categories': {}}
+
+# the values that we derive from the most recently parsed Excel sheet.
+# These are the oil column indexes, the row field names, and the sheet
+# column values, which are each computed on first use.
+_sheet_cache = {'xl_sheet': None}
 
 
 def get_oil_column_indexes(xl_sheet):
@@ -18,14 +41,27 @@ def get_oil_column_indexes(xl_sheet):
 
         Return a dict with oil names as keys and a list of associated
         column indexes as values
+        - The result is memoized for the most recently parsed sheet, and
+          is shared, so it should not be modified.
     '''
+    sheet_cache = get_sheet_cache(xl_sheet)
+
+    if 'col_indexes' not in sheet_cache:
+        sheet_cache['col_indexes'] = _get_oil_column_indexes(xl_sheet)
+
+    return sheet_cache['col_indexes']
+
+
+def _get_oil_column_indexes(xl_sheet):
     col_headers = defaultdict(list)
     col_prev_name = None
 
-    for idx, col in enumerate(xl_sheet.columns):
+    header_row = next(xl_sheet.iter_rows(max_row=1, values_only=True))
+
+    for idx, header in enumerate(header_row):
         if idx >= 2:
-            if col[0].value is not None:
-                col_value = col[0].value.strip()
+            if header is not None:
+                col_value = header.strip()
 
                 col_headers[col_value].append(idx)
                 col_prev_name = col_value
@@ -56,37 +92,93 @@ def get_row_field_names(xl_sheet):
         For field names, we would like to keep them lowercase, strip out the
         special characters, and separate the individual word components of the
         field name with '_'
+
+        Return a dict with (category, property) tuples as keys and a list of
+        associated row indexes as values.  The properties of a single
+        category can be found with get_category_fields()
+
+        The result is memoized for the most recently parsed sheet, and
+        is shared, so it should not be modified.
     '''
-    row_fields = defaultdict(lambda: defaultdict(list))
+    sheet_cache = get_sheet_cache(xl_sheet)
+
+    if 'field_indexes' not in sheet_cache:
+        sheet_cache['field_indexes'] = _get_row_field_names(xl_sheet)
+
+    return sheet_cache['field_indexes']
+
+
+def _get_row_field_names(xl_sheet):
+    row_fields = {}
     row_prev_name = None
 
-    for idx, row in enumerate(xl_sheet.rows):
-        if all([(r.value is None) for r in row[:2]]):
+    for idx, row in enumerate(xl_sheet.iter_rows(max_col=2,
+                                                 values_only=True)):
+        if all([(r is None) for r in row]):
             category_name, field_name = None, None
-        elif row[0].value is not None:
-            category_name = custom_slugify(row[0].value).lower()
+        elif row[0] is not None:
+            category_name = slugify_name(row[0])
             row_prev_name = category_name
-            if row[1].value is not None:
-                field_name = custom_slugify(unicode(row[1].value)).lower()
+            if row[1] is not None:
+                field_name = slugify_name(str(row[1]))
             else:
                 field_name = None
         else:
             category_name = row_prev_name
-            if row[1].value is not None:
-                field_name = custom_slugify(unicode(row[1].value)).lower()
+            if row[1] is not None:
+                field_name = slugify_name(str(row[1]))
             else:
                 field_name = None
 
-        row_fields[category_name][field_name].append(idx)
+        row_fields.setdefault((category_name, field_name), []).append(idx)
 
     return row_fields
 
 
+def slugify_name(name):
+    '''
+        Get the slugified form of a category or property name from the
+        Excel sheet.  custom_slugify already gives us lowercase names.
+        The results are memoized, since the same names repeat over
+        many rows.
+    '''
+    if name not in _slug_cache:
+        _slug_cache[name] = custom_slugify(name)
+
+    return _slug_cache[name]
+
+
 def get_oil_columns(xl_sheet, col_indexes):
     '''
         Return the columns in the Excel sheet referenced by a list of indexes
+
+        Accessing the value of an openpyxl cell object is fairly expensive,
+        and we access the same oil data cells many times over, so the columns
+        are returned as tuples of plain cell values instead of cell objects.
+        The sheet is only read once, when we get the columns of the first
+        oil, and its transposed values are kept for the remaining oils.
+    '''
+    sheet_cache = get_sheet_cache(xl_sheet)
+
+    if 'columns' not in sheet_cache:
+        rows = xl_sheet.iter_rows(values_only=True)
+        sheet_cache['columns'] = list(zip(*rows))
+
+    sheet_columns = sheet_cache['columns']
+
+    return [sheet_columns[i] for i in col_indexes]
+
+
+def get_sheet_cache(xl_sheet):
+    '''
+        Get the cache of values derived from an Excel sheet.  The cache is
+        cleared if the sheet is not the one that we most recently parsed.
     '''
-    return [c for i, c in enumerate(xl_sheet.columns) if i in col_indexes]
+    if _sheet_cache['xl_sheet'] is not xl_sheet:
+        _sheet_cache.clear()
+        _sheet_cache['xl_sheet'] = xl_sheet
+
+    return _sheet_cache
 
 
 def get_oil_properties_by_name(oil_columns, field_indexes,
@@ -97,8 +189,30 @@ def get_oil_properties_by_name(oil_columns, field_indexes,
         - This function is intended to work on the oil data columns for a
           single oil, but this is not enforced.
     '''
-    return [[c[i] for i in field_indexes[category][name]]
-            for c in oil_columns]
+    idxs = field_indexes[(category, name)]
+
+    return [[c[i] for i in idxs] for c in oil_columns]
+
+
+def get_category_fields(field_indexes, category):
+    '''
+        Get the properties that exist within a single category, as a list of
+        (property, row indexes) tuples in the order they appear in the sheet.
+        - The categories are indexed all at once, on the first lookup for a
+          set of field indexes, so that a category lookup doesn't need to
+          scan the fields of every category.  The returned list is shared,
+          and should not be modified.
+    '''
+    if _category_cache['field_indexes'] is not field_indexes:
+        categories = defaultdict(list)
+
+        for (c, f), idxs in field_indexes.items():
+            categories[c].append((f, idxs))
+
+        _category_cache['field_indexes'] = field_indexes
+        _category_cache['categories'] = categories
+
+    return _category_cache['categories'][category]
 
 
 def get_oil_properties_by_category(oil_columns, field_indexes,
@@ -109,11 +223,74 @@ def get_oil_properties_by_category(oil_columns, field_indexes,
         - This function is intended to work on the oil data columns for a
           single oil, but this is not enforced.
         - the oil properties will be returned as a dictionary.
+        - We typically query a number of categories (some of them more than
+          once) for a single oil before moving on to the next one, so the
+          results are memoized for the most recently used oil columns.
+          The returned dictionary is shared, and should not be modified.
+    '''
+    if (_props_cache['oil_columns'] is not oil_columns or
+            _props_cache['field_indexes'] is not field_indexes):
+        _props_cache['oil_columns'] = oil_columns
+        _props_cache['field_indexes'] = field_indexes
+        _props_cache['categories'] = {}
+
+    cat_props = _props_cache['categories']
+
+    if category not in cat_props:
+        cat_props[category] = _get_oil_properties_by_category(oil_columns,
+                                                              field_indexes,
+                                                              category)
+
+    return cat_props[category]
+
+
+def get_oil_properties_as_array(oil_columns, field_indexes, category):
     '''
+        Get all oil data properties for each column of oil data, that exist
+        within a single category, as a numpy array of the cell values.
+        - This function is intended to work on the oil data columns for a
+          single oil, but this is not enforced.
+        - Returns a tuple of (prop_names, values), in which the values are
+          indexed as values[property, column, row].  The row is the
+          position of a property amongst its rows within the category,
+          which is only ever non-zero for a repeated property name.
+          Properties with fewer rows than others are padded with None.
+        - The values are kept as objects, since the cells are not all
+          numeric.  A numeric slice can be converted with
+          .astype(np.float64), in which any empty cells become NaN.
+        - A category with no properties gives us no prop_names, and an
+          empty array of values.
+    '''
+    cat_fields = get_category_fields(field_indexes, category)
+    prop_names = tuple(name for name, _idxs in cat_fields)
+    num_rows = max([len(idxs) for _name, idxs in cat_fields] + [0])
+
+    values = np.full((len(prop_names), len(oil_columns), num_rows), None,
+                     dtype=object)
+
+    for f, (_name, idxs) in enumerate(cat_fields):
+        for c, col in enumerate(oil_columns):
+            values[f, c, :len(idxs)] = [col[i] for i in idxs]
+
+    return prop_names, values
+
+
+def _get_oil_properties_by_category(oil_columns, field_indexes,
+                                    category):
     ret = {}
-    cat_fields = field_indexes[category]
-    for f, idxs in cat_fields.iteritems():
+    cat_fields = get_category_fields(field_indexes, category)
+    for f, idxs in cat_fields:
         ret[f] = [[c[i] for i in idxs]
                   for c in oil_columns]
 
     return ret
+
+
+def build_row(prop_names, values):
+    '''
+        Build a dictionary of the oil data properties for a single column
+        of oil data.
+        - prop_names: The list of property names
+        - values: A list of Excel cell values representing the properties.
+    '''
+    return dict(zip(prop_names, map(itemgetter(0), values)))
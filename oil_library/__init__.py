@@ -7,8 +7,6 @@ import os
 import sys
 import logging
 
-from pkg_resources import get_distribution
-
 from sqlalchemy import create_engine
 from sqlalchemy.exc import UnboundExecutionError
 from sqlalchemy.orm.exc import NoResultFound
@@ -25,6 +23,17 @@ _oillib_path = os.path.dirname(__file__)
 __module_folder__ = __file__.split(os.sep)[-2]
 _db_file = 'OilLib.db'
 _db_file_path = os.path.join(_oillib_path, _db_file)
+_db_engine = None
+
+
+def _get_db_engine():
+    'the engine for our database, created once and shared by our sessions'
+    global _db_engine
+
+    if _db_engine is None:
+        _db_engine = create_engine('sqlite:///' + _db_file_path)
+
+    return _db_engine
 
 
 def _get_db_session():
@@ -35,12 +44,14 @@ def _get_db_session():
     try:
         eng = session.get_bind()
 
-        if eng.url.database.split(os.path.sep)[-2:] != [__module_folder__,
-                                                        _db_file]:
+        # no need to inspect the database path of our own engine
+        if (eng is not _db_engine and
+                eng.url.database.split(os.path.sep)[-2:] != [__module_folder__,
+                                                             _db_file]):
             raise UnboundExecutionError
 
     except UnboundExecutionError:
-        session.bind = create_engine('sqlite:///' + _db_file_path)
+        session.bind = _get_db_engine()
 
     return session
 
@@ -55,6 +66,12 @@ log_levels = {"debug": logging.DEBUG,
               }
 logger_format = '%(levelname)s - %(module)8s - line:%(lineno)d - %(message)s'
 
+_console_log_config = {'format': logger_format}
+
+# only call force for py 3.8 or greater
+if sys.version_info >= (3, 8):
+    _console_log_config['force'] = True  # make sure this gets set up
+
 
 # utility for setting up console logging
 def initialize_console_log(level='debug'):
@@ -71,19 +88,9 @@ def initialize_console_log(level='debug'):
 
     '''
 
-    level = log_levels[level.lower()]
-
-    ver = sys.version_info
-    # only call force for py 3.8 or greater
-    if ver.major == 3 and ver.minor >= 8:
-        logging.basicConfig(force=True,  # make sure this gets set up
-                            stream=sys.stdout,
-                            level=level,
-                            format=logger_format)
-    else:
-        logging.basicConfig(stream=sys.stdout,
-                            level=level,
-                            format=logger_format)
+    logging.basicConfig(stream=sys.stdout,
+                        level=log_levels[level.lower()],
+                        **_console_log_config)
 
 
 def add_file_log(filename, level='info'):
@@ -103,7 +110,23 @@ def add_file_log(filename, level='info'):
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 
-from .factory import get_oil, get_oil_props
+# The factory pulls in the oil property and estimation modules, and with
+# them scipy, so on py 3.7 or greater we only import it when get_oil() or
+# get_oil_props() are first asked for.  Our models, and SQLAlchemy, are
+# still imported with the package, since we need them for our DB session.
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in ('get_oil', 'get_oil_props'):
+            from .factory import get_oil, get_oil_props
+
+            globals().update(get_oil=get_oil, get_oil_props=get_oil_props)
+
+            return globals()[name]
+
+        raise AttributeError('module {!r} has no attribute {!r}'
+                             .format(__name__, name))
+else:
+    from .factory import get_oil, get_oil_props
 
 #_sample_oils.update({k: get_oil(v, max_cuts=2)
 #                     for k, v in sample_oils._sample_oils.iteritems()})
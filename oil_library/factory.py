@@ -5,8 +5,16 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from collections import OrderedDict
+from numbers import Integral
+from operator import attrgetter
+
+from past.builtins import basestring
+
 import numpy as np
 
+from sqlalchemy import bindparam
+from sqlalchemy.ext import baked
 from sqlalchemy.orm.exc import NoResultFound, MultipleResultsFound
 
 from . import _get_db_session
@@ -20,6 +28,25 @@ from .utilities import estimations as est
 from .imported_record.estimations import ImportedRecordWithEstimation
 from .json_record.estimations import JsonRecordWithEstimation
 
+# Our database queries for an oil are always the same, with only the
+# ADIOS ID or name changing, so we let SQLAlchemy cache their compiled
+# form instead of building them anew for every oil we get.
+_bakery = baked.bakery()
+
+_oil_by_adios_id = _bakery(lambda session: session.query(Oil)
+                           .filter(Oil.adios_oil_id == bindparam('adios_id')))
+_oil_by_name = _bakery(lambda session: session.query(Oil)
+                       .filter(Oil.name == bindparam('name')))
+
+# the number of oils we keep with a database session, most recently used last
+_oil_cache_size = 256
+
+# the database ids that we remove from a JSON payload, and the oil
+# attributes containing lists of records that might also have them.
+_db_id_attrs = ('id', 'oil_id', 'imported_record_id', 'estimated_id')
+_db_list_attrs = ('cuts', 'densities', 'kvis', 'molecular_weights',
+                  'sara_fractions', 'sara_densities')
+
 
 def get_oil_props(oil_info, max_cuts=None):
     '''
@@ -49,6 +76,9 @@ def get_oil(oil_data_in, max_cuts=None):
                           unique, so if it is not, we will raise an exception.
     :type oil_data_in: str or dict
 
+    Identifiers that are not strings are only accepted as integers, for
+    which we look up their string form.
+
     Optional arg:
 
     :param max_cuts: This is ** only ** used for _sample_oils which dont have
@@ -67,43 +97,107 @@ def get_oil(oil_data_in, max_cuts=None):
         return oil_obj
     #elif oil_data_in in _sample_oils:
         #return _sample_oils[oil_data_in]
+    elif (isinstance(oil_data_in, (basestring, Integral)) and
+            not isinstance(oil_data_in, bool)):
+        return _get_cached_oil(_get_db_session(), str(oil_data_in).strip())
     else:
-        session = _get_db_session()
+        raise TypeError('An oil is identified by a JSON payload dict, '
+                        'or by its ADIOS ID or name, not by {0!r}'
+                        .format(oil_data_in))
 
-        adios_id = str(oil_data_in).strip().upper()
-        results = session.query(Oil).filter(Oil.adios_oil_id == adios_id)
 
-        try:
-            oil = results.one()
-            oil.preload_linked_attributes()
+def _get_cached_oil(session, oil_data_in):
+    '''
+        The oils we have recently looked up are kept with the session,
+        like the session keeps the identity of the objects it has loaded.
+        If the oil is not kept, or is no longer in the session, we query
+        the database for it.
 
-            return oil
-        except (AttributeError, NoResultFound):
-            pass
+        An oil is kept under the form of the identifier that found it,
+        so an ADIOS ID is found again regardless of its case or spacing.
+    '''
+    oil_cache = session.info.setdefault('oil_library.get_oil', OrderedDict())
+
+    adios_id = _as_adios_id(oil_data_in)
+    id_key = ('adios_oil_id', adios_id)
+    name_key = ('name', oil_data_in)
+
+    key = id_key if id_key in oil_cache else name_key
+    oil = oil_cache.pop(key, None)
 
-        print("querying DB:")
-        print("Oil.name == ", repr(oil_data_in))
-        results = session.query(Oil).filter(Oil.name == oil_data_in)
+    if oil is None or oil not in session:
+        oil = _get_oil_from_db(session, oil_data_in)
 
-        try:
-            oil = results.one()
+        if adios_id is not None and oil.adios_oil_id == adios_id:
+            key = id_key
+        else:
+            key = name_key
+
+    oil_cache[key] = oil
+
+    while len(oil_cache) > _oil_cache_size:
+        oil_cache.popitem(last=False)
+
+    return oil
+
+
+def _get_oil_from_db(session, oil_data_in):
+    '''
+        Query the database for an oil, first by its Adios ID, and then
+        by its name.
+    '''
+    adios_id = _as_adios_id(oil_data_in)
+
+    if adios_id is not None:
+        oil = (_oil_by_adios_id(session).params(adios_id=adios_id)
+               .one_or_none())
+
+        if oil is not None:
             oil.preload_linked_attributes()
             return oil
-        except MultipleResultsFound as ex:
-            ids = ", ".join([oil.adios_oil_id for oil in results])
-            ex.message = ('Multiple oils with name "{0}" found '
-                          'having ADIOS IDs {{{1}}}. '
-                          'You may want to find your oil using its unique '
-                          'ADIOS ID instead.'
-                          .format(oil_data_in, ids))
-            ex.args = (ex.message, )
-
-            raise ex
-        except NoResultFound as ex:
-            ex.message = ('Oil with identifier "{0}", not found in database.'
-                          .format(oil_data_in))
-            ex.args = (ex.message, )
-            raise ex
+
+    print("querying DB:")
+    print("Oil.name == ", repr(oil_data_in))
+    results = _oil_by_name(session).params(name=oil_data_in)
+
+    try:
+        oil = results.one_or_none()
+    except MultipleResultsFound as ex:
+        ids = ", ".join([oil.adios_oil_id for oil in results])
+        ex.message = ('Multiple oils with name "{0}" found '
+                      'having ADIOS IDs {{{1}}}. '
+                      'You may want to find your oil using its unique '
+                      'ADIOS ID instead.'
+                      .format(oil_data_in, ids))
+        ex.args = (ex.message, )
+
+        raise ex
+
+    if oil is None:
+        ex = NoResultFound('Oil with identifier "{0}", not found in '
+                           'database.'.format(oil_data_in))
+        ex.message = ex.args[0]
+
+        raise ex
+
+    oil.preload_linked_attributes()
+    return oil
+
+
+def _as_adios_id(oil_data_in):
+    '''
+        Get the form of an oil identifier that we would find in the
+        database as an ADIOS ID, or None if it can't be an ADIOS ID.
+        ADIOS IDs are short, and never contain spaces, so most oil names
+        can be passed straight on to the name lookup.
+    '''
+    adios_id = str(oil_data_in).strip().upper()
+
+    if (len(adios_id.split()) == 1 and
+            len(adios_id) <= Oil.adios_oil_id.type.length):
+        return adios_id
+    else:
+        return None
 
 
 def prune_db_ids(oil_):
@@ -113,18 +207,13 @@ def prune_db_ids(oil_):
         misleading.
         We probably only need to do it here in this module.
     '''
-    for attr in ('id', 'oil_id', 'imported_record_id', 'estimated_id'):
-        if attr in oil_:
-            del oil_[attr]
+    for attr in _db_id_attrs:
+        oil_.pop(attr, None)
 
-    for list_attr in ('cuts', 'densities', 'kvis', 'molecular_weights',
-                      'sara_fractions', 'sara_densities'):
-        if list_attr in oil_:
-            for item in oil_[list_attr]:
-                for attr in ('id', 'oil_id', 'imported_record_id',
-                             'estimated_id'):
-                    if attr in item:
-                        del item[attr]
+    for list_attr in _db_list_attrs:
+        for item in oil_.get(list_attr, ()):
+            for attr in _db_id_attrs:
+                item.pop(attr, None)
 
 
 def _estimate_missing_oil_props(oil_obj, oil_json, max_cuts):
@@ -151,11 +240,7 @@ def _estimate_missing_oil_props(oil_obj, oil_json, max_cuts):
         del oil_obj.record.sara_densities[:]
 
         # Component Fractional estimations
-        _add_component_mol_wt(oil_obj, json_obj)
-
-        _add_component_mass_fractions(oil_obj, json_obj)
-
-        _add_component_densities(oil_obj, json_obj)
+        _add_components(oil_obj, json_obj)
 
 
 def _add_missing_density_info(oil_obj):
@@ -178,32 +263,42 @@ def _add_kvis_from_dvis(oil_obj, oil_json):
     '''
     if hasattr(oil_json.record, 'dvis'):
         dvis_list = list(oil_json.non_redundant_dvis())
-        densities = [oil_json.density_at_temp(d.ref_temp_k)
-                     for d in dvis_list]
 
-        for dv, rho in zip(dvis_list, densities):
-            oil_obj.record.kvis.append(oil_json.dvis_obj_to_kvis_obj(dv, rho))
+        if len(dvis_list) > 0:
+            # density_at_temp() will estimate the densities for all our
+            # temperatures at once, but gives us a scalar for a single one.
+            temps = np.array([d.ref_temp_k for d in dvis_list])
+            densities = np.atleast_1d(oil_json.density_at_temp(temps))
 
-    oil_obj.record.kvis.sort(key=lambda k: (k.weathering, k.ref_temp_k))
+            oil_obj.record.kvis.extend([
+                oil_json.dvis_obj_to_kvis_obj(dv, rho)
+                for dv, rho in zip(dvis_list, densities)
+            ])
+
+    oil_obj.record.kvis.sort(key=attrgetter('weathering', 'ref_temp_k'))
 
 
 def _add_inert_fractions(oil_obj, oil_json):
-    f_res, f_asph, _estimated_res, estimated_asph = oil_json.inert_fractions()
+    record = oil_obj.record
+
+    if (record.resins_fraction is not None and
+            record.asphaltenes_fraction is not None):
+        return
+
+    f_res, f_asph, _estimated_res, _estimated_asph = oil_json.inert_fractions()
 
-    if oil_obj.record.resins_fraction is None:
-        oil_obj.record.resins_fraction = f_res
+    if record.resins_fraction is None:
+        record.resins_fraction = f_res
 
-    if oil_obj.record.asphaltenes_fraction is None:
-        oil_obj.record.asphaltenes_fraction = f_asph
+    if record.asphaltenes_fraction is None:
+        record.asphaltenes_fraction = f_asph
 
 
 def kvis_exists(kvis, kwargs):
     temperature = kwargs['ref_temp_k']
     weathering = kwargs.get('weathering', 0.0)
-    return len([v for v in kvis
-                if (v.ref_temp_k == temperature and
-                    v.weathering == weathering)
-                ]) > 0
+    return any(v.ref_temp_k == temperature and v.weathering == weathering
+               for v in kvis)
 
 
 def _normalize_cuts(oil_obj):
@@ -214,46 +309,45 @@ def _normalize_cuts(oil_obj):
     # clear it out.
     del oil_obj.record.cuts[:]
 
-    for T_i, f_evap_i in zip(temps, fractions):
-        oil_obj.record.cuts.append(Cut(vapor_temp_k=T_i, fraction=f_evap_i))
+    oil_obj.record.cuts.extend([
+        Cut(vapor_temp_k=T_i, fraction=f_evap_i)
+        for T_i, f_evap_i in zip(temps, fractions)
+    ])
 
 
-def _add_component_mol_wt(oil_obj, json_obj):
-    temps = json_obj.component_temps()
-    mol_wts = json_obj.component_mol_wt()
-    c_types = json_obj.component_types()
-
-    for T_i, mol_wt_i, c_type in zip(temps, mol_wts, c_types):
-        (oil_obj.record.molecular_weights
-         .append(MolecularWeight(sara_type=c_type,
-                                 g_mol=mol_wt_i,
-                                 ref_temp_k=T_i)))
-
-
-def _add_component_mass_fractions(oil_obj, oil_json):
+def _add_components(oil_obj, oil_json):
+    '''
+        Add the estimated molecular weights, mass fractions, and densities
+        of our oil components.  These share a common indexing scheme, along
+        with the component temperatures and types, so we build all three
+        sequences in a single pass over the components.
+    '''
     temps = oil_json.component_temps()
-    fracs = oil_json.component_mass_fractions()
     c_types = oil_json.component_types()
-
-    for T_i, f_i, c_type in zip(temps, fracs, c_types):
-        oil_obj.record.sara_fractions.append(SARAFraction(sara_type=c_type,
-                                                          fraction=f_i,
-                                                          ref_temp_k=T_i))
-
-
-def _add_component_densities(oil_obj, oil_json):
-    densities = oil_json.component_densities()
+    mol_wts = oil_json.component_mol_wt()
     fracs = oil_json.component_mass_fractions()
-    temps = oil_json.component_temps()
-    c_types = oil_json.component_types()
+    densities = oil_json.component_densities()
 
     # we need to scale our densities to match our aggregate density
     rho0_oil = oil_json.density_at_temp(273.15 + 15)
-    Cf_dens = (rho0_oil / np.sum(fracs * densities))
+    Cf_dens = rho0_oil / np.dot(fracs, densities)
 
     densities *= Cf_dens
 
-    for T_i, rho, c_type in zip(temps, densities, c_types):
-        oil_obj.record.sara_densities.append(SARADensity(sara_type=c_type,
-                                                         density=rho,
-                                                         ref_temp_k=T_i))
+    mol_wt_objs, frac_objs, dens_objs = [], [], []
+
+    for T_i, c_type, mol_wt_i, f_i, rho in zip(temps, c_types, mol_wts,
+                                               fracs, densities):
+        mol_wt_objs.append(MolecularWeight(sara_type=c_type,
+                                           g_mol=mol_wt_i,
+                                           ref_temp_k=T_i))
+        frac_objs.append(SARAFraction(sara_type=c_type,
+                                      fraction=f_i,
+                                      ref_temp_k=T_i))
+        dens_objs.append(SARADensity(sara_type=c_type,
+                                     density=rho,
+                                     ref_temp_k=T_i))
+
+    oil_obj.record.molecular_weights.extend(mol_wt_objs)
+    oil_obj.record.sara_fractions.extend(frac_objs)
+    oil_obj.record.sara_densities.extend(dens_objs)
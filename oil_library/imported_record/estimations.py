@@ -12,6 +12,8 @@ from __future__ import unicode_literals
 
 from future import standard_library
 standard_library.install_aliases()
+from bisect import bisect_right
+from operator import attrgetter
 from builtins import zip
 from builtins import range
 from builtins import *
@@ -40,9 +42,11 @@ def clamp(x, M, zeta=0.03):
         We make use of a zeta value to tune the parameters nu, resulting in a
         smooth transition as we cross the M boundary.
     '''
+    denom = 1.0 + np.exp(-15 * (x - M))
+
     return (x -
-            (old_div(x, (1.0 + np.e ** (-15 * (x - M))) ** (1.0 / (1 + zeta)))) +
-            (old_div(M, (1.0 + np.e ** (-15 * (x - M))) ** (1.0 / (1 - zeta)))))
+            (old_div(x, denom ** (1.0 / (1 + zeta)))) +
+            (old_div(M, denom ** (1.0 / (1 - zeta)))))
 
 
 def _inverse_linear_curve(y, a, b, M, zeta=0.12):
@@ -73,7 +77,7 @@ class ImportedRecordWithEstimation(object):
             return the object that has the lowest temperature
         '''
         if len(obj_list) > 0:
-            return sorted(obj_list, key=lambda d: d.ref_temp_k)[0]
+            return min(obj_list, key=attrgetter('ref_temp_k'))
         else:
             return None
 
@@ -88,39 +92,31 @@ class ImportedRecordWithEstimation(object):
 
             We accept only a scalar temperature or a sequence of temperatures
         '''
-        if hasattr(temperature, '__iter__'):
-            # we like to deal with numpy arrays as opposed to simple iterables
-            temperature = np.array(temperature)
+        if len(obj_list) <= 1:
+            return obj_list
 
         # our requested number of objs can have a range [0 ... listsize-1]
         if num >= len(obj_list):
             num = len(obj_list) - 1
 
-        temp_diffs = np.array([abs(obj.ref_temp_k - temperature)
-                               for obj in obj_list]).T
+        # we work with a row of temperature differences for each of our
+        # temperatures, even if we were given a single temperature.
+        ref_temps = np.array([obj.ref_temp_k for obj in obj_list])
+        temp_diffs = np.abs(np.array(temperature, ndmin=2).T - ref_temps)
 
-        if len(obj_list) <= 1:
-            return obj_list
-        else:
-            # we probably don't really need this for such a short list,
-            # but we use a numpy 'introselect' partial sort method for speed
-            try:
-                # temp_diffs for sequence of temps
-                closest_idx = np.argpartition(temp_diffs, num)[:, :num]
-            except IndexError:
-                # temp_diffs for single temp
-                closest_idx = np.argpartition(temp_diffs, num)[:num]
+        # we probably don't really need this for such a short list,
+        # but we use a numpy 'introselect' partial sort method for speed
+        closest_idx = np.argpartition(temp_diffs, num)[:, :num]
 
-            try:
-                # sequence of temperatures result
-                closest = [sorted([obj_list[i] for i in r],
-                                  key=lambda x: x.ref_temp_k)
-                           for r in closest_idx]
-            except TypeError:
-                # single temperature result
-                closest = sorted([obj_list[i] for i in closest_idx],
-                                 key=lambda x: x.ref_temp_k)
+        closest = [sorted([obj_list[i] for i in r],
+                          key=lambda x: x.ref_temp_k)
+                   for r in closest_idx]
 
+        if np.ndim(temperature) == 0:
+            # single temperature result
+            return closest[0]
+        else:
+            # sequence of temperatures result
             return closest
 
     @classmethod
@@ -142,26 +138,35 @@ class ImportedRecordWithEstimation(object):
 
             We accept only a scalar temperature or a sequence of temperatures
         '''
-        temperature = np.array(temperature).reshape(-1, 1)
+        if np.ndim(temperature) == 0:
+            # A single temperature is our most common case, and we can find
+            # its bounds in our few objects without making any arrays.
+            ordered = sorted(obj_list, key=attrgetter('ref_temp_k'))
+            num_below = bisect_right([obj.ref_temp_k for obj in ordered],
+                                     temperature)
+            max_idx = len(ordered) - 1
 
-        if len(obj_list) <= 1:
-            # range where the lowest and highest are basically the same.
-            obj_list *= 2
+            return [(ordered[min(max(num_below - 1, 0), max_idx)],
+                     ordered[min(num_below, max_idx)])]
 
-        geq_temps = temperature >= [obj.ref_temp_k for obj in obj_list]
+        temperature = np.array(temperature).reshape(-1)
 
-        high_and_oob = np.all(geq_temps, axis=1)
-        low_and_oob = np.all(geq_temps ^ True, axis=1)
+        ref_temps = np.array([obj.ref_temp_k for obj in obj_list])
+        temp_order = np.argsort(ref_temps, kind='mergesort')
 
-        rho_idxs0 = np.argmin(geq_temps, axis=1)
-        rho_idxs0[rho_idxs0 > 0] -= 1
-        rho_idxs0[high_and_oob] = len(obj_list) - 1
+        # the number of reference temperatures at or below each temperature
+        # gives us the index of the upper bound, and the one below it is
+        # our lower bound.  Out of bounds temperatures are clipped to
+        # the range of the lowest or highest temperature.
+        num_below = np.searchsorted(ref_temps[temp_order], temperature,
+                                    side='right')
+        max_idx = len(obj_list) - 1
 
-        rho_idxs1 = (rho_idxs0 + 1).clip(0, len(obj_list) - 1)
-        rho_idxs1[low_and_oob] = 0
+        rho_idxs0 = temp_order[(num_below - 1).clip(0, max_idx)]
+        rho_idxs1 = temp_order[num_below.clip(0, max_idx)]
 
         return list(zip([obj_list[i] for i in rho_idxs0],
-                   [obj_list[i] for i in rho_idxs1]))
+                        [obj_list[i] for i in rho_idxs1]))
 
     def culled_measurement(self, attr_name, non_null_attrs):
         '''
@@ -179,8 +184,8 @@ class ImportedRecordWithEstimation(object):
         '''
         if hasattr(self.record, attr_name):
             obj_list = [o for o in getattr(self.record, attr_name)
-                        if all([(getattr(o, attr) is not None)
-                                for attr in non_null_attrs])]
+                        if all(getattr(o, attr) is not None
+                               for attr in non_null_attrs)]
 
             for o in obj_list:
                 if o.weathering is None:
@@ -267,9 +272,12 @@ class ImportedRecordWithEstimation(object):
         else:
             temperature = min_temp if temperature < min_temp else temperature
 
-        ref_density, ref_temp_k = self._get_reference_densities(densities,
+        closest_values = self._bounding_density_values(densities,
+                                                       temperature)
+
+        ref_density, ref_temp_k = self._get_reference_densities(closest_values,
                                                                 temperature)
-        k_rho_t = self._vol_expansion_coeff(densities, temperature)
+        k_rho_t = self._vol_expansion_coeff(closest_values, temperature)
 
         rho_t = est.density_at_temp(ref_density, ref_temp_k,
                                     temperature, k_rho_t)
@@ -289,47 +297,37 @@ class ImportedRecordWithEstimation(object):
         '''
         return self.density_at_temp()
 
-    def _get_reference_densities(self, densities, temperature):
+    def _bounding_density_values(self, densities, temperature):
         '''
-            Given a temperature, we return the best measured density,
-            and its reference temperature, to be used in calculation.
-
-            For our purposes, it is the density closest to the given
-            temperature.
+            Given a temperature, or temperatures, we return the values of
+            the densities that bound them as an array of
+            (kg_m_3, ref_temp_k) pairs, with a lower and upper bound pair
+            for each temperature.
         '''
         closest_densities = self.bounding_temperatures(densities, temperature)
 
-        try:
-            # sequence of ranges
-            density_values = np.array([[d.kg_m_3 for d in r]
-                                       for r in closest_densities])
-            ref_temp_values = np.array([[d.ref_temp_k for d in r]
-                                        for r in closest_densities])
-
-            greater_than = np.all((temperature > ref_temp_values.T).T, axis=1)
+        return np.array([[(d.kg_m_3, d.ref_temp_k) for d in r]
+                         for r in closest_densities])
 
-            density_values[greater_than, 0] = density_values[greater_than, 1]
-            ref_temp_values[greater_than, 0] = ref_temp_values[greater_than, 1]
+    def _get_reference_densities(self, closest_values, temperature):
+        '''
+            Given a temperature, we return the best measured density,
+            and its reference temperature, to be used in calculation.
 
-            return density_values[:, 0], ref_temp_values[:, 0]
-        except TypeError:
-            # single range
-            density_values = np.array([d.kg_m_3 for d in closest_densities])
-            ref_temp_values = np.array([d.ref_temp_k
-                                        for d in closest_densities])
+            For our purposes, it is the density closest to the given
+            temperature.  This is the lower bound, unless the temperature
+            is above both its bounding densities.
+        '''
+        greater_than = np.all((temperature > closest_values[:, :, 1].T).T,
+                              axis=1)
 
-            if np.all(temperature > ref_temp_values):
-                return density_values[1], ref_temp_values[1]
-            else:
-                return density_values[0], ref_temp_values[0]
+        ref_values = closest_values[np.arange(len(closest_values)),
+                                    greater_than.astype(np.intp)]
 
-    def _vol_expansion_coeff(self, densities, temperature):
-        closest_densities = self.bounding_temperatures(densities, temperature)
+        return ref_values[:, 0], ref_values[:, 1]
 
+    def _vol_expansion_coeff(self, closest_values, temperature):
         temperature = np.array(temperature)
-        closest_values = np.array([[(d.kg_m_3, d.ref_temp_k)
-                                    for d in r]
-                                   for r in closest_densities])
 
         args_list = [[t for d in v for t in d]
                      for v in closest_values]
@@ -372,7 +370,7 @@ class ImportedRecordWithEstimation(object):
         dvis_dict = dict([((d.weathering, d.ref_temp_k), d.kg_ms)
                           for d in self.culled_dvis()])
 
-        non_redundant_keys = set(dvis_dict.keys()).difference(list(kvis_dict.keys()))
+        non_redundant_keys = set(dvis_dict).difference(kvis_dict)
         for k in sorted(non_redundant_keys):
             yield DVis(ref_temp_k=k[1],
                        weathering=k[0],
@@ -399,13 +397,19 @@ class ImportedRecordWithEstimation(object):
                      for k in self.culled_kvis()]
 
         if hasattr(self.record, 'dvis'):
-            dvis_list = [((d.ref_temp_k, d.weathering),
-                          (est.dvis_to_kvis(d.kg_ms,
-                                            self.density_at_temp(d.ref_temp_k)
-                                            ),
-                           True)
-                          )
-                         for d in list(self.non_redundant_dvis())]
+            dvis_objs = list(self.non_redundant_dvis())
+            dvis_list = []
+
+            if len(dvis_objs) > 0:
+                # we get the densities for all our temperatures at once,
+                # but density_at_temp() gives us a scalar for a single one.
+                temps = np.array([d.ref_temp_k for d in dvis_objs])
+                rhos = np.atleast_1d(self.density_at_temp(temps))
+                kvis = est.dvis_to_kvis(np.array([d.kg_ms for d in dvis_objs]),
+                                        rhos)
+
+                dvis_list = [((d.ref_temp_k, d.weathering), (k, True))
+                             for d, k in zip(dvis_objs, kvis)]
 
             agg = dict(dvis_list)
             agg.update(kvis_list)
@@ -583,7 +587,15 @@ class ImportedRecordWithEstimation(object):
         f_res, f_asph, _estimated_res, _estimated_asph = self.inert_fractions()
         cuts = list(self.culled_cuts())
 
-        if len(cuts) == 0:
+        if len(cuts) == 1:
+            # Like curve_fit(), we refuse to fit a line to a single point.
+            raise TypeError('Improper input: we need at least two cuts '
+                            'to fit, got 1')
+
+        if len(set(c.vapor_temp_k for c in cuts)) < 2:
+            # We have no cuts, or our cuts all share one temperature and
+            # don't tell us the slope of our distillation curve.  Either way,
+            # we estimate our cuts from our API.
             if self.record.api is not None:
                 oil_api = self.record.api
             else:
@@ -595,7 +607,13 @@ class ImportedRecordWithEstimation(object):
         else:
             BP_i, fevap_i = list(zip(*[(c.vapor_temp_k, c.fraction) for c in cuts]))
 
-        popt, _pcov = curve_fit(_linear_curve, BP_i, fevap_i)
+        # a straight line fit has a closed form least squares solution,
+        # so we don't need to iterate towards it.
+        # Like curve_fit(), we refuse to fit NaN or infinite values.
+        BP_i = np.asarray_chkfinite(BP_i, dtype=np.float64)
+        fevap_i = np.asarray_chkfinite(fevap_i, dtype=np.float64)
+
+        popt = np.polyfit(BP_i, fevap_i, 1)
         f_cutoff = _linear_curve(732.0, *popt)  # center of asymptote (< 739)
         popt = popt.tolist() + [f_cutoff]
 
@@ -629,19 +647,31 @@ class ImportedRecordWithEstimation(object):
     def component_temps(self, N=10):
         cut_temps = self.get_cut_temps(N)
 
-        component_temps = np.append([1015.0, 1015.0],
-                                    list(zip(cut_temps, cut_temps)))
-
-        return np.roll(component_temps, -2)
+        return self._component_array(cut_temps, cut_temps, 1015.0, 1015.0)
 
     def component_types(self, N=10):
-        T_i = self.component_temps(N)
+        cut_temps = self.get_cut_temps(N)
 
-        types_out = ['Saturates', 'Aromatics'] * (old_div(len(T_i), 2) - 1)
+        types_out = ['Saturates', 'Aromatics'] * len(cut_temps)
         types_out += ['Resins', 'Asphaltenes']
 
         return types_out
 
+    @classmethod
+    def _component_array(cls, sat_i, arom_i, resin, asphaltene):
+        '''
+            Our components are ordered as the pairs of saturates and
+            aromatics of each cut, followed by the resins and asphaltenes.
+        '''
+        out = np.empty(2 * len(sat_i) + 2)
+
+        out[:-2:2] = sat_i
+        out[1:-2:2] = arom_i
+        out[-2] = resin
+        out[-1] = asphaltene
+
+        return out
+
     def component_mol_wt(self, N=10):
         cut_temps = self.get_cut_temps(N)
 
@@ -649,11 +679,10 @@ class ImportedRecordWithEstimation(object):
 
     @classmethod
     def estimate_component_mol_wt(cls, boiling_points):
-        mw_list = np.append([est.resin_mol_wt(), est.asphaltene_mol_wt()],
-                            list(zip(est.saturate_mol_wt(boiling_points),
-                                est.aromatic_mol_wt(boiling_points))))
-
-        return np.roll(mw_list, -2)
+        return cls._component_array(est.saturate_mol_wt(boiling_points),
+                                    est.aromatic_mol_wt(boiling_points),
+                                    est.resin_mol_wt(),
+                                    est.asphaltene_mol_wt())
 
     def component_densities(self, N=10):
         cut_temps = self.get_cut_temps(N)
@@ -662,11 +691,10 @@ class ImportedRecordWithEstimation(object):
 
     @classmethod
     def estimate_component_densities(cls, boiling_points):
-        rho_list = np.append([est.resin_density(), est.asphaltene_density()],
-                             list(zip(est.saturate_densities(boiling_points),
-                                 est.aromatic_densities(boiling_points))))
-
-        return np.roll(rho_list, -2)
+        return cls._component_array(est.saturate_densities(boiling_points),
+                                    est.aromatic_densities(boiling_points),
+                                    est.resin_density(),
+                                    est.asphaltene_density())
 
     def component_specific_gravity(self, N=10):
         rho_list = self.component_densities(N)
@@ -683,20 +711,43 @@ class ImportedRecordWithEstimation(object):
         f_sat_i = fmass_i / 2.0
         f_arom_i = fmass_i / 2.0
 
+        # the saturate & aromatic properties at our cut temperatures don't
+        # change from one approximation to the next, so we get them once.
+        cut_props = self.cut_component_props(cut_temps)
+
+        # Our approximations converge steadily, so we can stop once they
+        # no longer change by any meaningful amount.  Our fractions can be
+        # very small, so this needs to be a relative tolerance.
         for _i in range(20):
-            f_sat_i, f_arom_i = self.verify_cut_fractional_masses(fmass_i,
-                                                                  cut_temps,
-                                                                  f_sat_i,
-                                                                  f_arom_i)
+            prev_f_sat_i, prev_f_arom_i = f_sat_i, f_arom_i
 
-        mf_list = np.append([f_res, f_asph],
-                            list(zip(f_sat_i, f_arom_i)))
+            f_sat_i, f_arom_i = self.verify_cut_fractional_masses(
+                fmass_i, cut_temps, f_sat_i, f_arom_i, cut_props=cut_props
+            )
 
-        return np.roll(mf_list, -2)
+            if (np.allclose(f_sat_i, prev_f_sat_i, rtol=1e-6, atol=0.0) and
+                    np.allclose(f_arom_i, prev_f_arom_i, rtol=1e-6, atol=0.0)):
+                break
+
+        return self._component_array(f_sat_i, f_arom_i, f_res, f_asph)
+
+    @classmethod
+    def cut_component_props(cls, T_i):
+        '''
+            The molecular weights and specific gravities of the saturates
+            and aromatics of distillate masses with boiling points T_i.
+        '''
+        M_w_sat_i = est.saturate_mol_wt(T_i)
+        M_w_arom_i = est.aromatic_mol_wt(T_i)
+
+        SG_sat_i = est.specific_gravity(est.saturate_densities(T_i))
+        SG_arom_i = est.specific_gravity(est.aromatic_densities(T_i))
+
+        return M_w_sat_i, M_w_arom_i, SG_sat_i, SG_arom_i
 
     @classmethod
     def verify_cut_fractional_masses(cls, fmass_i, T_i, f_sat_i, f_arom_i,
-                                     prev_f_sat_i=None):
+                                     prev_f_sat_i=None, cut_props=None):
         '''
             Assuming a distillate mass with a boiling point T_i,
             We propose what the component fractional masses might be.
@@ -722,22 +773,20 @@ class ImportedRecordWithEstimation(object):
 
             It is intended that we run this function iteratively to obtain a
             successively approximated value for f_sat_i and f_arom_i.
+            When doing so, the component properties at T_i can be computed
+            once with cut_component_props() and passed in as cut_props.
         '''
         assert np.allclose(fmass_i, f_sat_i + f_arom_i)
 
-        M_w_sat_i = est.saturate_mol_wt(T_i)
-        M_w_arom_i = est.aromatic_mol_wt(T_i)
+        if cut_props is None:
+            cut_props = cls.cut_component_props(T_i)
+
+        M_w_sat_i, M_w_arom_i, SG_sat_i, SG_arom_i = cut_props
 
         M_w_avg_i = (old_div(M_w_sat_i * f_sat_i, fmass_i) +
                      old_div(M_w_arom_i * f_arom_i, fmass_i))
 
         # estimate specific gravity
-        rho_sat_i = est.saturate_densities(T_i)
-        SG_sat_i = est.specific_gravity(rho_sat_i)
-
-        rho_arom_i = est.aromatic_densities(T_i)
-        SG_arom_i = est.specific_gravity(rho_arom_i)
-
         SG_avg_i = (old_div(SG_sat_i * f_sat_i, fmass_i) +
                     old_div(SG_arom_i * f_arom_i, fmass_i))
 
@@ -236,7 +236,7 @@ def add_component_densities(imp_rec_obj, oil):
 
     # we need to scale our densities to match our aggregate density
     rho0_oil = imp_rec_obj.density_at_temp(273.15 + 15)
-    Cf_dens = (rho0_oil / np.sum(fracs * densities))
+    Cf_dens = rho0_oil / np.dot(fracs, densities)
 
     densities *= Cf_dens
 
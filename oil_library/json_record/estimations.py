@@ -23,6 +23,58 @@ class JsonRecordWithEstimation(ImportedRecordWithEstimation):
         self._normalize_json_attrs()
         self._k_v2 = None
 
+        # Our record is our own copy of the JSON payload, and is not changed
+        # after it is normalized, so we can keep the estimations that we
+        # would otherwise repeat for almost every oil property.
+        self._inert_fractions = None
+        self._cut_values = {}
+        self._culled_measurements = {}
+        self._densities_at_temp = {}
+        self._aggregate_kvis = None
+
+    def culled_measurement(self, attr_name, non_null_attrs):
+        key = (attr_name, tuple(non_null_attrs))
+
+        if key not in self._culled_measurements:
+            self._culled_measurements[key] = \
+                (super(JsonRecordWithEstimation, self)
+                 .culled_measurement(attr_name, non_null_attrs))
+
+        return self._culled_measurements[key]
+
+    def density_at_temp(self, temperature=288.15):
+        if hasattr(temperature, '__iter__'):
+            return (super(JsonRecordWithEstimation, self)
+                    .density_at_temp(temperature))
+
+        if temperature not in self._densities_at_temp:
+            self._densities_at_temp[temperature] = \
+                (super(JsonRecordWithEstimation, self)
+                 .density_at_temp(temperature))
+
+        return self._densities_at_temp[temperature]
+
+    def aggregate_kvis(self):
+        if self._aggregate_kvis is None:
+            self._aggregate_kvis = (super(JsonRecordWithEstimation, self)
+                                    .aggregate_kvis())
+
+        return self._aggregate_kvis
+
+    def inert_fractions(self):
+        if self._inert_fractions is None:
+            self._inert_fractions = (super(JsonRecordWithEstimation, self)
+                                     .inert_fractions())
+
+        return self._inert_fractions
+
+    def normalized_cut_values(self, N=10):
+        if N not in self._cut_values:
+            self._cut_values[N] = (super(JsonRecordWithEstimation, self)
+                                   .normalized_cut_values(N))
+
+        return self._cut_values[N]
+
     def _normalize_json_attrs(self):
         self._default_attrs_with_weathering()
         self._default_inert_attrs()
@@ -14,7 +14,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 import copy
-from itertools import groupby, chain
+from operator import attrgetter
 from future.moves.itertools import zip_longest
 
 try:
@@ -345,6 +345,21 @@ class OilProps(OilWithEstimation):
 
         return c_op
 
+    @staticmethod
+    def _sorted_components(components):
+        '''
+        Sort the component records of our oil in increasing boiling point,
+        and in decreasing sara_type for components sharing a boiling point
+        (Saturates before Aromatics, Resins before Asphaltenes).
+
+        Python's sort is stable, so we can do this with two simple sorts,
+        the last one being by our primary key.
+        '''
+        by_type = sorted(components, key=attrgetter('sara_type'),
+                         reverse=True)
+
+        return sorted(by_type, key=attrgetter('ref_temp_k'))
+
     def _init_sara(self):
         '''
         initialize self._sara as a numpy array. The information is structured
@@ -359,29 +374,9 @@ class OilProps(OilWithEstimation):
 
         Omit components that have 0 mass fraction
         '''
-        all_comp = list(chain(*[sorted(list(g), key=lambda s: s.sara_type,
-                                       reverse=True)
-                                for _k, g
-                                in groupby(sorted(self.record.sara_fractions,
-                                                  key=lambda s: s.ref_temp_k),
-                                           lambda x: x.ref_temp_k)]
-                              ))
-
-        all_dens = list(chain(*[sorted(list(g), key=lambda s: s.sara_type,
-                                       reverse=True)
-                                for _k, g
-                                in groupby(sorted(self.record.sara_densities,
-                                                  key=lambda s: s.ref_temp_k),
-                                           lambda x: x.ref_temp_k)]
-                              ))
-
-        all_mw = list(chain(*[sorted(list(g), key=lambda s: s.sara_type,
-                                     reverse=True)
-                              for _k, g
-                              in groupby(sorted(self.record.molecular_weights,
-                                                key=lambda s: s.ref_temp_k),
-                                         lambda x: x.ref_temp_k)]
-                            ))
+        all_comp = self._sorted_components(self.record.sara_fractions)
+        all_dens = self._sorted_components(self.record.sara_densities)
+        all_mw = self._sorted_components(self.record.molecular_weights)
 
         items = []
         sum_frac = 0.
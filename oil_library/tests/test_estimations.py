@@ -0,0 +1,91 @@
+'''
+Tests for the oil record estimations
+'''
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numpy as np
+
+import pytest
+
+from oil_library import _get_db_session
+from oil_library.models import ImportedRecord
+from oil_library.imported_record.estimations import \
+    ImportedRecordWithEstimation
+from oil_library.json_record.estimations import JsonRecordWithEstimation
+
+
+def json_record(cuts):
+    return JsonRecordWithEstimation({'name': 'test oil',
+                                     'api': 30.0,
+                                     'densities': [{'kg_m_3': 875.0,
+                                                    'ref_temp_k': 288.15}],
+                                     'kvis': [{'m_2_s': 1e-5,
+                                               'ref_temp_k': 288.15}],
+                                     'resins_fraction': 0.05,
+                                     'asphaltenes_fraction': 0.02,
+                                     'cuts': cuts})
+
+
+def test_normalized_cut_values():
+    rec = json_record([{'vapor_temp_k': 400.0, 'fraction': 0.2},
+                       {'vapor_temp_k': 500.0, 'fraction': 0.5}])
+
+    T_i, fevap_i = rec.normalized_cut_values()
+
+    assert len(T_i) == len(fevap_i) == 10
+    assert all(T_i[1:] > T_i[:-1])
+    assert all(fevap_i[1:] > fevap_i[:-1])
+
+
+def test_normalized_cut_values_single_cut():
+    # like curve_fit(), we can't fit a line to a single cut
+    with pytest.raises(TypeError):
+        json_record([{'vapor_temp_k': 400.0,
+                      'fraction': 0.2}]).normalized_cut_values()
+
+
+def test_normalized_cut_values_single_temp():
+    '''
+        Cuts that all share one temperature don't give us a distillation
+        curve, so we estimate our cuts from our API, like we do when we
+        have no cuts.
+    '''
+    T_i, fevap_i = json_record([{'vapor_temp_k': 400.0, 'fraction': 0.2},
+                                {'vapor_temp_k': 400.0, 'fraction': 0.3}]
+                               ).normalized_cut_values()
+    api_T_i, api_fevap_i = json_record([]).normalized_cut_values()
+
+    assert np.all(np.isfinite(T_i))
+    assert np.allclose(T_i, api_T_i)
+    assert np.allclose(fevap_i, api_fevap_i)
+
+
+def test_component_mass_fractions_converged():
+    '''
+        We stop approximating the saturate and aromatic fractions once
+        they converge, which should give us the values of the full
+        20 approximations.
+    '''
+    rec = (_get_db_session().query(ImportedRecord)
+           .filter(ImportedRecord.adios_oil_id == 'AD01759').one())
+    rec = ImportedRecordWithEstimation(rec)
+
+    f_res, f_asph, _estimated_res, _estimated_asph = rec.inert_fractions()
+    cut_temps, fmass_i = rec.get_cut_temps_fmasses()
+
+    f_sat_i = fmass_i / 2.0
+    f_arom_i = fmass_i / 2.0
+
+    for _i in range(20):
+        f_sat_i, f_arom_i = rec.verify_cut_fractional_masses(fmass_i,
+                                                             cut_temps,
+                                                             f_sat_i,
+                                                             f_arom_i)
+
+    expected = rec._component_array(f_sat_i, f_arom_i, f_res, f_asph)
+
+    assert np.allclose(rec.component_mass_fractions(), expected,
+                       rtol=1e-5, atol=0.0)
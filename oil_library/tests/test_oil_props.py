@@ -9,6 +9,7 @@ from __future__ import unicode_literals
 from past.builtins import basestring
 
 import copy
+from collections import OrderedDict
 
 import numpy as np
 
@@ -17,8 +18,10 @@ from pytest import raises
 
 import unit_conversion as uc
 
-from oil_library import get_oil_props, get_oil
+from oil_library import get_oil_props, get_oil, _get_db_session
+from oil_library import factory
 
+from sqlalchemy import event
 from sqlalchemy.orm.exc import NoResultFound
 
 
@@ -58,6 +61,76 @@ def test_get_oil_id(adios_id, name):
         assert o.adios_oil_id == adios_id.strip().upper()
 
 
+def test_get_oil_cached():
+    o = get_oil('LUCKENBACH FUEL OIL')
+
+    assert get_oil('LUCKENBACH FUEL OIL') is o
+
+    # once the oil is no longer in the session, we should query for it again
+    _get_db_session().expunge(o)
+    o2 = get_oil('LUCKENBACH FUEL OIL')
+
+    assert o2 is not o
+    assert o2.adios_oil_id == o.adios_oil_id
+    assert get_oil('LUCKENBACH FUEL OIL') is o2
+
+
+@pytest.fixture
+def oil_queries(monkeypatch):
+    '''
+        The oils that get_oil() queries the database for, starting with an
+        empty get_oil() cache.
+    '''
+    queries = []
+    engine = _get_db_session().get_bind()
+
+    def count_oil_queries(conn, cursor, statement, parameters, context,
+                          executemany):
+        if statement.lstrip().startswith('SELECT oils.'):
+            queries.append(statement)
+
+    monkeypatch.setitem(_get_db_session().info, 'oil_library.get_oil',
+                        OrderedDict())
+
+    event.listen(engine, 'before_cursor_execute', count_oil_queries)
+    yield queries
+    event.remove(engine, 'before_cursor_execute', count_oil_queries)
+
+
+def test_get_oil_cache_normalized(oil_queries):
+    o = get_oil('AD01759')
+
+    assert get_oil('ad01759') is o
+    assert get_oil(' AD01759 ') is o
+    assert len(oil_queries) == 1
+
+
+def test_get_oil_cache_eviction(monkeypatch, oil_queries):
+    monkeypatch.setattr(factory, '_oil_cache_size', 1)
+
+    get_oil('AD01759')
+    get_oil('AD01759')
+    assert len(oil_queries) == 1
+
+    # our cache only has room for one oil, so the first one is evicted,
+    # and we need to query the database for it again.
+    get_oil('LUCKENBACH FUEL OIL')
+    assert len(oil_queries) == 2
+
+    o = get_oil('AD01759')
+
+    assert len(oil_queries) == 3
+    assert o.adios_oil_id == 'AD01759'
+    assert len(_get_db_session().info['oil_library.get_oil']) == 1
+
+
+@pytest.mark.parametrize('search', [['LUCKENBACH FUEL OIL'], None, True,
+                                    2.5])
+def test_get_oil_bad_identifier(search):
+    with raises(TypeError):
+        get_oil(search)
+
+
 # Record number 51: "AUTOMOTIVE GASOLINE, EXXON" is found in database
 # but mass fractions do not sum up to one so valid OilProps object not created.
 # In this case return None
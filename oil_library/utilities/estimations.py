@@ -11,7 +11,6 @@ from __future__ import unicode_literals
 
 from future import standard_library
 standard_library.install_aliases()
-from builtins import range
 from builtins import *
 from past.utils import old_div
 import numpy as np
@@ -175,11 +174,12 @@ def cut_temps_from_api(api, N=5):
                 Vol. 1, pp. 43-62
 
         Generate distillation cut temperatures from the oil's API.
+        The temperatures are evenly spaced, and in ascending order.
     '''
     T_0 = 457.0 - 3.34 * api
     T_G = 1357.0 - 247.7 * np.log(api)
 
-    return np.array([(T_0 + old_div(T_G * i, N)) for i in range(N)])
+    return T_0 + T_G * np.arange(N) / N
 
 
 def fmasses_from_cuts(f_evap_i):
@@ -197,7 +197,7 @@ def fmasses_flat_dist(f_res, f_asph, N=5):
     '''
         Generate a flat distribution of N distillation cut fractional masses.
     '''
-    return np.array([old_div((1.0 - f_res - f_asph), N)] * N)
+    return np.full(N, (1.0 - f_res - f_asph) / N)
 
 
 def saturate_mol_wt(boiling_point):